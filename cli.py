@@ -0,0 +1,148 @@
+"""
+Єдина точка входу для всіх операцій з базами даних.
+
+Модулі завдань (а разом з ними Faker, psycopg2, pymongo та certifi)
+імпортуються лише тоді, коли їх потребує обрана команда, тому короткі
+запуски (наприклад, з cron) не витрачають час на непотрібні імпорти.
+
+Приклади:
+    python cli.py create-tables
+    python cli.py seed
+    python cli.py query --combined
+    python cli.py update
+    python cli.py cats seed 20
+    python cli.py cats migrate
+    python cli.py cats find Мурка
+    python cli.py cats search Мур
+"""
+
+
+import argparse
+import importlib
+import os
+import sys
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_task_module(task: str, module: str):
+    """
+    Імпортує модуль з каталогу завдання.
+
+    Модулі завдань імпортують один одного як 'connect', 'seed' тощо
+    і читають config.ini з поточного каталогу, тому каталог завдання
+    додається до sys.path і стає робочим.
+
+    Args:
+        task (str): Каталог завдання ('task-1' або 'task-2')
+        module (str): Назва модуля
+
+    Returns:
+        module: Імпортований модуль
+    """
+    task_dir = os.path.join(BASE_DIR, task)
+    os.chdir(task_dir)
+    if task_dir not in sys.path:
+        sys.path.insert(0, task_dir)
+    return importlib.import_module(module)
+
+
+def cmd_create_tables(args):
+    """Створення таблиць PostgreSQL."""
+    return load_task_module('task-1', 'create_tables').main
+
+
+def cmd_seed(args):
+    """Заповнення таблиць PostgreSQL випадковими даними."""
+    return load_task_module('task-1', 'seed').main
+
+
+def cmd_query(args):
+    """Виконання звітів та збереження результатів у CSV."""
+    query_executor = load_task_module('task-1', 'query_executor')
+    return lambda: query_executor.main(force=args.force, combined=args.combined)
+
+
+def cmd_update(args):
+    """Виконання запитів на модифікацію даних."""
+    return load_task_module('task-1', 'update_db').main
+
+
+def cmd_cats(args):
+    """Операції з колекцією котів у MongoDB."""
+    if args.action == 'seed':
+        seed = load_task_module('task-2', 'seed')
+        return lambda: seed.seed_database(args.count)
+    if args.action == 'migrate':
+        return load_task_module('task-2', 'cat_search').main
+
+    cats = load_task_module('task-2', 'main')
+    actions = {
+        'menu': lambda: cats.main(),
+        'list': lambda: cats.show_all_cats(),
+        'find': lambda: cats.find_cat_by_name(args.name),
+        'search': lambda: cats.search_cats_by_prefix(args.prefix),
+        'update-age': lambda: cats.update_cat_age(args.name, args.age),
+        'add-feature': lambda: cats.add_cat_feature(args.name, args.feature),
+        'delete': lambda: cats.delete_cat_by_name(args.name),
+        'delete-all': lambda: cats.delete_all_cats(),
+    }
+    return actions[args.action]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Створює парсер аргументів командного рядка.
+
+    Returns:
+        argparse.ArgumentParser: Парсер з усіма підкомандами
+    """
+    parser = argparse.ArgumentParser(description="Операції з базами даних PostgreSQL та MongoDB")
+    # Лише імпортувати модулі команди без її виконання (для перевірки часу старту)
+    parser.add_argument('--import-only', action='store_true', help=argparse.SUPPRESS)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('create-tables', help="Створити таблиці").set_defaults(handler=cmd_create_tables)
+    commands.add_parser('seed', help="Заповнити таблиці даними").set_defaults(handler=cmd_seed)
+    commands.add_parser('update', help="Виконати запити на модифікацію").set_defaults(handler=cmd_update)
+
+    query = commands.add_parser('query', help="Виконати звіти та зберегти у CSV")
+    query.add_argument('--force', action='store_true', help="Перезаписати всі звіти")
+    query.add_argument('--combined', action='store_true', help="Статистика одним проходом")
+    query.set_defaults(handler=cmd_query)
+
+    cats = commands.add_parser('cats', help="Операції з котами у MongoDB")
+    actions = cats.add_subparsers(dest='action', required=True)
+    actions.add_parser('menu', help="Інтерактивне меню")
+    actions.add_parser('list', help="Показати всіх котів")
+    actions.add_parser('delete-all', help="Видалити всіх котів")
+    actions.add_parser('migrate', help="Заповнити name_key в наявних котах")
+    actions.add_parser('seed', help="Заповнити колекцію").add_argument('count', type=int, nargs='?', default=20)
+    actions.add_parser('find', help="Знайти кота за ім'ям").add_argument('name')
+    actions.add_parser('search', help="Знайти котів за початком імені").add_argument('prefix')
+    actions.add_parser('delete', help="Видалити кота").add_argument('name')
+    update_age = actions.add_parser('update-age', help="Оновити вік кота")
+    update_age.add_argument('name')
+    update_age.add_argument('age', type=int)
+    add_feature = actions.add_parser('add-feature', help="Додати характеристику коту")
+    add_feature.add_argument('name')
+    add_feature.add_argument('feature')
+    cats.set_defaults(handler=cmd_cats)
+
+    return parser
+
+
+def main(argv=None):
+    """
+    Головна функція: розбирає аргументи та виконує обрану команду.
+    """
+    args = build_parser().parse_args(argv)
+    # Обробник імпортує потрібні модулі та повертає дію для виконання
+    action = args.handler(args)
+    if not args.import_only:
+        action()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Модуль для асинхронної роботи з базою даних PostgreSQL через asyncpg.
+Асинхронний відповідник create_connection, execute_query та
+execute_modification_query з власним пулом з'єднань.
+asyncpg використовує бінарний протокол PostgreSQL для декодування результатів.
+"""
+
+
+import asyncio
+import configparser
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, List, Dict, Any, Optional, Sequence, Tuple
+import asyncpg
+from connect import get_db_config
+from query_executor import QUERIES, save_to_csv
+
+
+# Розмір пулу з'єднань за замовчуванням
+POOL_MIN_SIZE = 2
+POOL_MAX_SIZE = 10
+
+
+@asynccontextmanager
+async def create_pool(
+    min_size: int = POOL_MIN_SIZE,
+    max_size: int = POOL_MAX_SIZE,
+) -> AsyncGenerator[asyncpg.Pool, None]:
+    """
+    Створює пул асинхронних з'єднань з базою даних PostgreSQL.
+
+    Args:
+        min_size (int): Мінімальна кількість з'єднань у пулі
+        max_size (int): Максимальна кількість з'єднань у пулі
+
+    Yields:
+        asyncpg.Pool: Пул з'єднань
+
+    Raises:
+        asyncpg.PostgresError: Якщо виникла помилка при з'єднанні з базою даних
+        FileNotFoundError: Якщо файл конфігурації не знайдено
+    """
+    pool = None
+    try:
+        db_config = get_db_config()
+        db_config["port"] = int(db_config["port"])
+        pool = await asyncpg.create_pool(min_size=min_size, max_size=max_size, **db_config)
+        yield pool
+    except (asyncpg.PostgresError, OSError) as e:
+        print(f"Помилка з'єднання з PostgreSQL: {e}")
+        raise
+    except configparser.Error as e:
+        print(f"Помилка читання конфігурації: {e}")
+        raise
+    finally:
+        if pool is not None:
+            await pool.close()
+
+
+async def execute_query(pool: asyncpg.Pool, query: str, *args: Any) -> Optional[List[Dict[str, Any]]]:
+    """
+    Виконує SQL-запит та повертає результат.
+
+    Args:
+        pool (asyncpg.Pool): Пул з'єднань
+        query (str): SQL-запит для виконання (параметри позначаються $1, $2, ...)
+        *args: Параметри запиту
+
+    Returns:
+        Optional[List[Dict[str, Any]]]: Результат запиту або None у разі помилки
+    """
+    try:
+        records = await pool.fetch(query, *args)
+        return [dict(record) for record in records]
+
+    except Exception as e:
+        print(f"Помилка виконання запиту: {e}")
+        return None
+
+
+async def execute_modification_query(pool: asyncpg.Pool, query: str, query_name: str) -> None:
+    """
+    Виконує запит на модифікацію даних.
+
+    Args:
+        pool (asyncpg.Pool): Пул з'єднань
+        query (str): SQL-запит для виконання
+        query_name (str): Назва операції для виводу
+    """
+    try:
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(query)
+        print(f"Операцію '{query_name}' успішно виконано")
+    except Exception as e:
+        print(f"Помилка виконання операції '{query_name}': {e}")
+
+
+async def execute_modification_batch(
+    pool: asyncpg.Pool,
+    query: str,
+    args: Sequence[Tuple[Any, ...]],
+    query_name: str,
+) -> None:
+    """
+    Виконує один параметризований запит на модифікацію для набору параметрів
+    в одній транзакції (executemany передає всі набори за один обмін з сервером).
+
+    Args:
+        pool (asyncpg.Pool): Пул з'єднань
+        query (str): SQL-запит з параметрами $1, $2, ...
+        args: Набори параметрів
+        query_name (str): Назва операції для виводу
+    """
+    try:
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.executemany(query, args)
+        print(f"Операцію '{query_name}' успішно виконано ({len(args)} записів)")
+    except Exception as e:
+        print(f"Помилка виконання операції '{query_name}': {e}")
+
+
+async def run_reports(pool: asyncpg.Pool) -> Dict[str, Optional[List[Dict[str, Any]]]]:
+    """
+    Виконує всі звіти з каталогу QUERIES одночасно на з'єднаннях пулу.
+
+    Args:
+        pool (asyncpg.Pool): Пул з'єднань
+
+    Returns:
+        Dict[str, Optional[List[Dict[str, Any]]]]: Результати за назвами звітів
+    """
+    results = await asyncio.gather(*(execute_query(pool, query) for query in QUERIES.values()))
+    return dict(zip(QUERIES.keys(), results))
+
+
+async def main():
+    """
+    Головна функція: виконує каталог звітів асинхронно та зберігає результати.
+    """
+    try:
+        async with create_pool() as pool:
+            start = time.perf_counter()
+            reports = await run_reports(pool)
+            print(f"Виконано {len(reports)} запитів за {time.perf_counter() - start:.3f} с")
+
+            for filename, results in reports.items():
+                if results:
+                    save_to_csv(results, filename)
+                else:
+                    print(f"Запит {filename} не повернув результатів")
+
+    except Exception as e:
+        print(f"Помилка підключення до бази даних: {e}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
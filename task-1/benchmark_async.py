@@ -0,0 +1,114 @@
+"""
+Модуль для порівняння асинхронного шару asyncpg з синхронним psycopg2:
+пропускна здатність конкурентних малих запитів та швидкість декодування
+великого результату.
+"""
+
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+import psycopg2
+from connect import create_connection, get_db_config
+from async_db import create_pool
+
+
+# Кількість малих запитів та паралельних з'єднань
+SMALL_QUERIES = 5000
+CONCURRENCY = 10
+
+SQL_SMALL_PSYCOPG = "SELECT id, title, status_id FROM tasks WHERE id = %s"
+SQL_SMALL_ASYNCPG = "SELECT id, title, status_id FROM tasks WHERE id = $1"
+SQL_LARGE = "SELECT id, title, description, status_id, user_id FROM tasks"
+
+
+def psycopg_small_worker(conn, task_ids: list) -> None:
+    """
+    Виконує малі запити на виділеному потоку з'єднанні psycopg2.
+
+    Args:
+        conn: Відкрите з'єднання psycopg2
+        task_ids (list): Ідентифікатори завдань для вибірки
+    """
+    with conn.cursor() as cursor:
+        for task_id in task_ids:
+            cursor.execute(SQL_SMALL_PSYCOPG, (task_id,))
+            cursor.fetchone()
+
+
+def benchmark_psycopg(task_ids: list) -> tuple:
+    """
+    Вимірює psycopg2: малі запити у пулі потоків та один великий запит.
+
+    Args:
+        task_ids (list): Ідентифікатори завдань для малих запитів
+
+    Returns:
+        tuple: (малих запитів за секунду, секунд на великий запит, рядків)
+    """
+    parts = [task_ids[i::CONCURRENCY] for i in range(CONCURRENCY)]
+    # З'єднання відкриваються до початку вимірювання, як і пул asyncpg
+    db_config = get_db_config()
+    connections = [psycopg2.connect(**db_config) for _ in range(CONCURRENCY)]
+    try:
+        with ThreadPoolExecutor(max_workers=CONCURRENCY) as executor:
+            start = time.perf_counter()
+            list(executor.map(psycopg_small_worker, connections, parts))
+            small_rate = len(task_ids) / (time.perf_counter() - start)
+    finally:
+        for conn in connections:
+            conn.close()
+
+    with create_connection() as conn:
+        with conn.cursor() as cursor:
+            start = time.perf_counter()
+            cursor.execute(SQL_LARGE)
+            rows = cursor.fetchall()
+            large_time = time.perf_counter() - start
+    return small_rate, large_time, len(rows)
+
+
+async def benchmark_asyncpg(task_ids: list) -> tuple:
+    """
+    Вимірює asyncpg: конкурентні малі запити через пул та один великий запит.
+
+    Args:
+        task_ids (list): Ідентифікатори завдань для малих запитів
+
+    Returns:
+        tuple: (малих запитів за секунду, секунд на великий запит, рядків)
+    """
+    async with create_pool(min_size=CONCURRENCY, max_size=CONCURRENCY) as pool:
+        start = time.perf_counter()
+        await asyncio.gather(*(pool.fetchrow(SQL_SMALL_ASYNCPG, task_id) for task_id in task_ids))
+        small_rate = len(task_ids) / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        rows = await pool.fetch(SQL_LARGE)
+        large_time = time.perf_counter() - start
+    return small_rate, large_time, len(rows)
+
+
+def main():
+    """
+    Головна функція: виводить порівняльну таблицю результатів.
+    """
+    try:
+        with create_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT id FROM tasks ORDER BY random() LIMIT %s", (SMALL_QUERIES,))
+                task_ids = [row[0] for row in cursor.fetchall()]
+
+        sync_result = benchmark_psycopg(task_ids)
+        async_result = asyncio.run(benchmark_asyncpg(task_ids))
+
+        print(f"{'Драйвер':>10} {'Малі запити/с':>15} {'Великий запит, с':>18} {'Рядків':>10}")
+        for name, (small_rate, large_time, rows) in (("psycopg2", sync_result), ("asyncpg", async_result)):
+            print(f"{name:>10} {small_rate:>15.0f} {large_time:>18.3f} {rows:>10}")
+
+    except Exception as e:
+        print(f"Помилка: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Модуль для порівняння швидкості keyset-пагінації та пагінації через OFFSET
+на глибоких сторінках списку завдань.
+"""
+
+
+import time
+from typing import Callable
+from connect import create_connection
+from task_pagination import list_tasks, encode_cursor, DEFAULT_PAGE_SIZE
+
+
+SQL_OFFSET_PAGE = """
+    SELECT t.id, t.title, t.description, t.status_id, t.user_id,
+           s.name as status, u.fullname, u.email
+    FROM tasks t
+    JOIN status s ON t.status_id = s.id
+    JOIN users u ON t.user_id = u.id
+    ORDER BY t.status_id, t.id
+    LIMIT %s OFFSET %s
+"""
+
+SQL_ROW_AT_OFFSET = """
+    SELECT status_id, id
+    FROM tasks
+    ORDER BY status_id, id
+    LIMIT 1 OFFSET %s
+"""
+
+
+def measure(func: Callable[[], None], repeats: int = 5) -> float:
+    """
+    Вимірює найкращий час виконання функції.
+
+    Args:
+        func: Функція для вимірювання
+        repeats (int): Кількість повторів
+
+    Returns:
+        float: Найменший час виконання у мілісекундах
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    """
+    Головна функція: вимірює час отримання сторінки на різній глибині.
+    """
+    pages = [1, 10, 100, 1000, 10000]
+
+    try:
+        with create_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT count(*) FROM tasks")
+                total = cursor.fetchone()[0]
+            print(f"Завдань у таблиці: {total}")
+            print(f"\n{'Сторінка':>10} {'OFFSET, мс':>12} {'Keyset, мс':>12}")
+
+            for page in pages:
+                offset = (page - 1) * DEFAULT_PAGE_SIZE
+                if offset >= total:
+                    break
+
+                def offset_page():
+                    with conn.cursor() as cursor:
+                        cursor.execute(SQL_OFFSET_PAGE, (DEFAULT_PAGE_SIZE, offset))
+                        cursor.fetchall()
+
+                # Курсор, що вказує на останній рядок попередньої сторінки
+                page_cursor = None
+                if offset > 0:
+                    with conn.cursor() as cursor:
+                        cursor.execute(SQL_ROW_AT_OFFSET, (offset - 1,))
+                        status_id, task_id = cursor.fetchone()
+                    page_cursor = encode_cursor("status", status_id, task_id)
+
+                def keyset_page():
+                    list_tasks(conn, order_by="status", cursor=page_cursor)
+
+                print(f"{page:>10} {measure(offset_page):>12.2f} {measure(keyset_page):>12.2f}")
+
+    except Exception as e:
+        print(f"Помилка: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Модуль для вимірювання масштабованості паралельного експорту звіту
+залежно від кількості процесів.
+"""
+
+
+import sys
+import time
+from parallel_export import parallel_export, remove_shards
+
+
+def main():
+    """
+    Головна функція: експортує звіт з різною кількістю процесів
+    і виводить пропускну здатність та ефективність масштабування.
+    """
+    report = sys.argv[1] if len(sys.argv) > 1 else "uncompleted_tasks"
+    worker_counts = [1, 2, 4, 8, 16]
+
+    try:
+        print(f"Звіт: {report}")
+        print(f"\n{'Процеси':>8} {'Час, с':>10} {'Рядків/с':>12} {'Прискорення':>12} {'Ефективність':>13}")
+
+        baseline = None
+        for workers in worker_counts:
+            start = time.perf_counter()
+            rows = parallel_export(report, workers, concatenate=False)
+            elapsed = time.perf_counter() - start
+            remove_shards(report)
+
+            if baseline is None:
+                baseline = elapsed
+            speedup = baseline / elapsed
+            efficiency = speedup / workers
+            print(f"{workers:>8} {elapsed:>10.2f} {rows / elapsed:>12.0f} {speedup:>12.2f} {efficiency:>12.0%}")
+
+    except Exception as e:
+        print(f"Помилка: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Модуль для порівняння швидкості повнотекстового пошуку через GIN-індекс
+з наївним скануванням ILIKE '%x%'.
+
+Завдання розмножуються в окремій схемі, яка видаляється після вимірювання,
+тому робоча таблиця tasks (а з нею звіти та журнал змін) не змінюється.
+"""
+
+
+import sys
+from connect import create_connection
+from benchmark_pagination import measure
+from task_search import search_tasks
+
+
+# Кількість завдань, до якої таблицю буде розмножено перед вимірюванням
+TARGET_TASKS = 1_000_000
+
+# Тимчасова схема з копією tasks; users та status беруться з public
+SCRATCH_SCHEMA = "search_benchmark"
+
+# LIKE ... INCLUDING ALL копіює стовпець search_vector та індекси, але не тригери,
+# тому вставки не змінюють лічильники версій і журнал user_changes.
+# id задаються явно, щоб не витрачати послідовність public.tasks
+SQL_CREATE_SCRATCH = f"""
+    DROP SCHEMA IF EXISTS {SCRATCH_SCHEMA} CASCADE;
+    CREATE SCHEMA {SCRATCH_SCHEMA};
+    CREATE TABLE {SCRATCH_SCHEMA}.tasks (LIKE public.tasks INCLUDING ALL);
+    ALTER TABLE {SCRATCH_SCHEMA}.tasks ALTER COLUMN id DROP DEFAULT;
+    INSERT INTO {SCRATCH_SCHEMA}.tasks (id, title, description, status_id, user_id)
+    SELECT id, title, description, status_id, user_id FROM public.tasks;
+"""
+
+SQL_GROW_TASKS = f"""
+    INSERT INTO {SCRATCH_SCHEMA}.tasks (id, title, description, status_id, user_id)
+    SELECT (SELECT max(id) FROM {SCRATCH_SCHEMA}.tasks) + row_number() OVER (),
+           title, description, status_id, user_id
+    FROM {SCRATCH_SCHEMA}.tasks
+    LIMIT %s
+"""
+
+SQL_ILIKE_SEARCH = """
+    SELECT t.id, t.title, t.description, s.name as status, u.fullname
+    FROM tasks t
+    JOIN status s ON t.status_id = s.id
+    JOIN users u ON t.user_id = u.id
+    WHERE t.title ILIKE %s OR t.description ILIKE %s
+    ORDER BY t.id
+    LIMIT %s
+"""
+
+# Без LIMIT: ORDER BY t.id LIMIT дозволяє зупинитися після перших збігів,
+# тоді як FTS має ранжувати всі збіги, тому вимірюємо і повний перебір
+SQL_ILIKE_COUNT = """
+    SELECT count(*)
+    FROM tasks t
+    WHERE t.title ILIKE %s OR t.description ILIKE %s
+"""
+
+
+def grow_tasks(connection, target: int) -> int:
+    """
+    Копіює завдання у тимчасову схему та розмножує їх до target.
+
+    Після виклику запити з'єднання до tasks звертаються до копії
+    (search_path), а users та status залишаються з public.
+
+    Args:
+        connection: З'єднання з базою даних
+        target (int): Бажана кількість завдань
+
+    Returns:
+        int: Кількість завдань після розмноження
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SQL_CREATE_SCRATCH)
+        cursor.execute(f"SELECT count(*) FROM {SCRATCH_SCHEMA}.tasks")
+        total = cursor.fetchone()[0]
+        while 0 < total < target:
+            cursor.execute(SQL_GROW_TASKS, (target - total,))
+            total += cursor.rowcount
+        cursor.execute(f"SET search_path TO {SCRATCH_SCHEMA}, public")
+        connection.commit()
+        cursor.execute(f"ANALYZE {SCRATCH_SCHEMA}.tasks")
+    return total
+
+
+def drop_scratch(connection) -> None:
+    """
+    Видаляє тимчасову схему з копією завдань.
+
+    Args:
+        connection: З'єднання з базою даних
+    """
+    connection.rollback()
+    with connection.cursor() as cursor:
+        cursor.execute(f"DROP SCHEMA IF EXISTS {SCRATCH_SCHEMA} CASCADE")
+    connection.commit()
+
+
+def run_benchmark(connection, terms: list) -> None:
+    """
+    Розмножує завдання та виводить таблицю затримок для кожного запиту.
+
+    Args:
+        connection: З'єднання з базою даних
+        terms (list): Пошукові запити
+    """
+    total = grow_tasks(connection, TARGET_TASKS)
+    print(f"Завдань у таблиці: {total}")
+    print(f"\n{'Запит':>20} {'ILIKE top-20, мс':>17} {'ILIKE усі, мс':>14} {'FTS, мс':>12}")
+
+    for term in terms:
+        pattern = f"%{term}%"
+
+        def ilike_search():
+            with connection.cursor() as cursor:
+                cursor.execute(SQL_ILIKE_SEARCH, (pattern, pattern, 20))
+                cursor.fetchall()
+
+        def ilike_count():
+            with connection.cursor() as cursor:
+                cursor.execute(SQL_ILIKE_COUNT, (pattern, pattern))
+                cursor.fetchone()
+
+        def fts_search():
+            search_tasks(connection, term)
+
+        print(
+            f"{term:>20} {measure(ilike_search, 3):>17.2f} "
+            f"{measure(ilike_count, 3):>14.2f} {measure(fts_search):>12.2f}"
+        )
+
+
+def main():
+    """
+    Головна функція: вимірює затримку пошуку для кількох запитів.
+    """
+    terms = sys.argv[1:] or ["звіт", "тривога", "художній гараж"]
+
+    try:
+        with create_connection() as conn:
+            try:
+                run_benchmark(conn, terms)
+            finally:
+                drop_scratch(conn)
+
+    except Exception as e:
+        print(f"Помилка: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -28,7 +28,10 @@ def create_table(connection, query: str) -> None:
         raise
 
 
-if __name__ == '__main__':
+def main():
+    """
+    Головна функція для створення таблиць, індексів та тригерів.
+    """
     # SQL-запит для створення таблиці користувачів
     SQL_CREATE_USERS_TABLE = """
     CREATE TABLE IF NOT EXISTS users (
@@ -63,6 +66,133 @@ if __name__ == '__main__':
     );
     """
 
+    # SQL-запит для створення індексів для keyset-пагінації завдань
+    SQL_CREATE_TASKS_INDEXES = """
+    CREATE INDEX IF NOT EXISTS idx_tasks_status_id_id ON tasks (status_id, id);
+    CREATE INDEX IF NOT EXISTS idx_tasks_user_id_id ON tasks (user_id, id);
+    CREATE INDEX IF NOT EXISTS idx_users_email_domain
+        ON users (lower(split_part(email, '@', 2)));
+    """
+
+    # SQL-запит для повнотекстового пошуку за назвою та описом завдання.
+    # PostgreSQL не має вбудованого стемера для української мови, тому
+    # використовується конфігурація 'simple': вона лише переводить слова
+    # у нижній регістр, а словоформи покриває префіксний пошук (див. task_search.py)
+    SQL_CREATE_TASKS_SEARCH = """
+    ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+        ) STORED;
+    CREATE INDEX IF NOT EXISTS idx_tasks_search_vector
+        ON tasks USING GIN (search_vector);
+    """
+
+    # SQL-запит для лічильників версій таблиць: тригери викликають nextval
+    # для послідовності таблиці після кожної зміни. Використовується кешем
+    # звітів у query_executor.py. nextval не блокує конкурентних записувачів
+    # і не відкочується разом з транзакцією
+    SQL_CREATE_TABLE_VERSIONS = """
+    CREATE SEQUENCE IF NOT EXISTS users_version_seq;
+    CREATE SEQUENCE IF NOT EXISTS status_version_seq;
+    CREATE SEQUENCE IF NOT EXISTS tasks_version_seq;
+
+    CREATE OR REPLACE FUNCTION bump_table_version() RETURNS trigger AS $$
+    BEGIN
+        PERFORM nextval((TG_TABLE_NAME || '_version_seq')::regclass);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    DROP TRIGGER IF EXISTS users_version ON users;
+    CREATE TRIGGER users_version
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON users
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version();
+
+    DROP TRIGGER IF EXISTS status_version ON status;
+    CREATE TRIGGER status_version
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON status
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version();
+
+    DROP TRIGGER IF EXISTS tasks_version ON tasks;
+    CREATE TRIGGER tasks_version
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON tasks
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version();
+    """
+
+    # SQL-запит для журналу змін, з якого read_model_sync.py оновлює
+    # документи користувачів у MongoDB. user_id = NULL означає, що змінилися
+    # дані всіх користувачів (наприклад, перейменовано статус). Тригери
+    # спрацьовують раз на команду і через таблиці переходів записують кожного
+    # зачепленого користувача один раз, тож масові вставки та оновлення завдань
+    # додають до журналу рядок на користувача, а не на кожне завдання. Таблиці переходів не можна задати
+    # для тригера з кількома подіями, тому на кожну подію окремий тригер
+    SQL_CREATE_CHANGE_LOG = """
+    CREATE TABLE IF NOT EXISTS user_changes (
+        id BIGSERIAL PRIMARY KEY,                      -- Порядковий номер зміни
+        user_id INTEGER,                               -- Користувач, документ якого застарів
+        changed_at TIMESTAMPTZ NOT NULL DEFAULT now()  -- Час зміни
+    );
+
+    CREATE OR REPLACE FUNCTION log_user_change() RETURNS trigger AS $$
+    BEGIN
+        IF TG_TABLE_NAME = 'status' THEN
+            INSERT INTO user_changes (user_id) VALUES (NULL);
+        ELSIF TG_TABLE_NAME = 'users' THEN
+            IF TG_OP = 'INSERT' THEN
+                INSERT INTO user_changes (user_id) SELECT id FROM new_rows;
+            ELSIF TG_OP = 'DELETE' THEN
+                INSERT INTO user_changes (user_id) SELECT id FROM old_rows;
+            ELSE
+                INSERT INTO user_changes (user_id)
+                SELECT id FROM old_rows UNION SELECT id FROM new_rows;
+            END IF;
+        ELSE
+            IF TG_OP = 'INSERT' THEN
+                INSERT INTO user_changes (user_id) SELECT DISTINCT user_id FROM new_rows;
+            ELSIF TG_OP = 'DELETE' THEN
+                INSERT INTO user_changes (user_id) SELECT DISTINCT user_id FROM old_rows;
+            ELSE
+                INSERT INTO user_changes (user_id)
+                SELECT user_id FROM old_rows UNION SELECT user_id FROM new_rows;
+            END IF;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    DROP TRIGGER IF EXISTS users_change_log_insert ON users;
+    CREATE TRIGGER users_change_log_insert
+        AFTER INSERT ON users REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION log_user_change();
+    DROP TRIGGER IF EXISTS users_change_log_update ON users;
+    CREATE TRIGGER users_change_log_update
+        AFTER UPDATE ON users REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION log_user_change();
+    DROP TRIGGER IF EXISTS users_change_log_delete ON users;
+    CREATE TRIGGER users_change_log_delete
+        AFTER DELETE ON users REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION log_user_change();
+
+    DROP TRIGGER IF EXISTS tasks_change_log_insert ON tasks;
+    CREATE TRIGGER tasks_change_log_insert
+        AFTER INSERT ON tasks REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION log_user_change();
+    DROP TRIGGER IF EXISTS tasks_change_log_update ON tasks;
+    CREATE TRIGGER tasks_change_log_update
+        AFTER UPDATE ON tasks REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION log_user_change();
+    DROP TRIGGER IF EXISTS tasks_change_log_delete ON tasks;
+    CREATE TRIGGER tasks_change_log_delete
+        AFTER DELETE ON tasks REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION log_user_change();
+
+    DROP TRIGGER IF EXISTS status_change_log ON status;
+    CREATE TRIGGER status_change_log
+        AFTER UPDATE OR DELETE ON status
+        FOR EACH STATEMENT EXECUTE FUNCTION log_user_change();
+    """
+
     try:
         with create_connection() as conn:
             # Створення таблиці users
@@ -77,5 +207,25 @@ if __name__ == '__main__':
             create_table(conn, SQL_CREATE_TASKS_TABLE)
             print("Таблицю 'tasks' успішно створено")
 
+            # Створення індексів для пагінації
+            create_table(conn, SQL_CREATE_TASKS_INDEXES)
+            print("Індекси для таблиці 'tasks' успішно створено")
+
+            # Створення індексу повнотекстового пошуку
+            create_table(conn, SQL_CREATE_TASKS_SEARCH)
+            print("Індекс повнотекстового пошуку успішно створено")
+
+            # Створення лічильників версій таблиць
+            create_table(conn, SQL_CREATE_TABLE_VERSIONS)
+            print("Лічильники версій таблиць та тригери успішно створено")
+
+            # Створення журналу змін для синхронізації з MongoDB
+            create_table(conn, SQL_CREATE_CHANGE_LOG)
+            print("Таблицю 'user_changes' та тригери успішно створено")
+
     except Exception as e:
         print(f"Помилка: {e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,313 @@
+"""
+Модуль для генерації змішаного навантаження на схему users/status/tasks.
+Виконує задану суміш читань (звіти query_executor, вибірка завдань користувача)
+та записів (оновлення статусу, додавання та видалення завдань, як в update_db.py)
+протягом заданого часу і виводить пропускну здатність та гістограми затримок.
+"""
+
+
+import argparse
+import bisect
+import math
+import random
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional
+import psycopg2
+from connect import create_connection
+from query_executor import QUERIES
+from seed import fake
+
+
+# Межі кошиків гістограми затримок у мілісекундах
+LATENCY_BUCKETS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000]
+
+# Суміш операцій за замовчуванням: назва -> вага
+DEFAULT_MIX = "user_tasks=60,report=5,update_status=20,insert_task=10,delete_task=5"
+
+
+class LoadContext:
+    """
+    Спільні для всіх потоків дані: ідентифікатори користувачів, статусів і завдань.
+    """
+
+    def __init__(self, connection):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT id FROM users")
+            self.user_ids = [row[0] for row in cursor.fetchall()]
+            cursor.execute("SELECT id FROM status")
+            self.status_ids = [row[0] for row in cursor.fetchall()]
+            cursor.execute("SELECT min(id), max(id) FROM tasks")
+            self.min_task_id, self.max_task_id = cursor.fetchone()
+
+    def random_task_id(self) -> int:
+        """Повертає випадковий ідентифікатор з діапазону наявних завдань."""
+        return random.randint(self.min_task_id or 1, self.max_task_id or 1)
+
+
+def op_user_tasks(cursor, ctx: LoadContext) -> None:
+    """Вибірка завдань випадкового користувача (як звіт user_tasks)."""
+    cursor.execute(
+        """
+        SELECT u.fullname, t.id, t.title, t.description, s.name as status
+        FROM tasks t
+        JOIN status s ON t.status_id = s.id
+        JOIN users u ON t.user_id = u.id
+        WHERE t.user_id = %s
+        """,
+        (random.choice(ctx.user_ids),)
+    )
+    cursor.fetchall()
+
+
+def op_report(cursor, ctx: LoadContext) -> None:
+    """Виконання випадкового звіту з каталогу query_executor."""
+    cursor.execute(random.choice(list(QUERIES.values())))
+    cursor.fetchall()
+
+
+def op_update_status(cursor, ctx: LoadContext) -> None:
+    """Оновлення статусу випадкового завдання."""
+    cursor.execute(
+        "UPDATE tasks SET status_id = %s WHERE id = %s",
+        (random.choice(ctx.status_ids), ctx.random_task_id())
+    )
+
+
+def op_insert_task(cursor, ctx: LoadContext) -> None:
+    """Додавання нового завдання з даними, згенерованими як у seed.py."""
+    cursor.execute(
+        """
+        INSERT INTO tasks (title, description, status_id, user_id)
+        VALUES (%s, %s, %s, %s)
+        """,
+        (
+            fake.sentence(nb_words=3),
+            fake.text(max_nb_chars=200),
+            random.choice(ctx.status_ids),
+            random.choice(ctx.user_ids)
+        )
+    )
+
+
+def op_delete_task(cursor, ctx: LoadContext) -> None:
+    """Видалення випадкового завдання."""
+    cursor.execute("DELETE FROM tasks WHERE id = %s", (ctx.random_task_id(),))
+
+
+OPERATIONS: Dict[str, Callable] = {
+    "user_tasks": op_user_tasks,
+    "report": op_report,
+    "update_status": op_update_status,
+    "insert_task": op_insert_task,
+    "delete_task": op_delete_task,
+}
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """
+    Розбирає суміш операцій у форматі 'назва=вага,назва=вага'.
+
+    Args:
+        mix (str): Опис суміші
+
+    Returns:
+        Dict[str, float]: Ваги операцій
+
+    Raises:
+        ValueError: Якщо операція невідома або вага від'ємна чи нескінченна
+    """
+    weights = {}
+    for item in mix.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise ValueError(f"Невідома операція: {name}")
+        value = float(weight)
+        if not math.isfinite(value) or value < 0:
+            raise ValueError(f"Вага операції {name} має бути невід'ємним числом: {weight.strip()}")
+        weights[name] = value
+    if not weights or sum(weights.values()) <= 0:
+        raise ValueError("Суміш операцій має містити хоча б одну додатну вагу")
+    return weights
+
+
+class LoadStats:
+    """
+    Потокобезпечний збір кількості операцій, помилок та затримок.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.lost_workers: List[str] = []
+
+    def record(self, name: str, latency_ms: float, error: bool = False) -> None:
+        """Додає результат однієї операції."""
+        with self.lock:
+            if error:
+                self.errors[name] += 1
+            else:
+                self.latencies[name].append(latency_ms)
+
+    def record_lost_worker(self, reason: str) -> None:
+        """Додає потік, який завершився достроково через втрату з'єднання."""
+        with self.lock:
+            self.lost_workers.append(reason)
+
+    def report(self, elapsed: float) -> None:
+        """
+        Виводить пропускну здатність, перцентилі та гістограму для кожної операції.
+
+        Args:
+            elapsed (float): Тривалість навантаження у секундах
+        """
+        total = sum(len(values) for values in self.latencies.values())
+        print(f"\nВсього операцій: {total} за {elapsed:.1f} с ({total / elapsed:.1f} оп./с)")
+        if self.lost_workers:
+            print(f"Увага: {len(self.lost_workers)} потоків завершилися достроково через втрату з'єднання, "
+                  f"навантаження було меншим за задане ({self.lost_workers[0]})")
+
+        for name in sorted(self.latencies.keys() | self.errors.keys()):
+            values = sorted(self.latencies[name])
+            print(f"\n{name}: {len(values)} оп., {len(values) / elapsed:.1f} оп./с, помилок: {self.errors[name]}")
+            if not values:
+                continue
+            p50, p95, p99 = (values[min(len(values) - 1, int(len(values) * q))] for q in (0.5, 0.95, 0.99))
+            print(f"  p50={p50:.2f} мс  p95={p95:.2f} мс  p99={p99:.2f} мс  max={values[-1]:.2f} мс")
+
+            counts = [0] * (len(LATENCY_BUCKETS) + 1)
+            for value in values:
+                counts[bisect.bisect_left(LATENCY_BUCKETS, value)] += 1
+            for i, count in enumerate(counts):
+                if not count:
+                    continue
+                label = f"<= {LATENCY_BUCKETS[i]} мс" if i < len(LATENCY_BUCKETS) else f"> {LATENCY_BUCKETS[-1]} мс"
+                bar = "#" * max(1, round(40 * count / len(values)))
+                print(f"  {label:>12} {count:>8} {bar}")
+
+
+class RateLimiter:
+    """
+    Розподіляє заплановані моменти запуску операцій між потоками
+    для відкритої моделі навантаження з фіксованою швидкістю.
+    """
+
+    def __init__(self, rate: float, start: float):
+        self.interval = 1.0 / rate
+        self.next_time = start
+        self.lock = threading.Lock()
+
+    def next_slot(self) -> float:
+        """Повертає запланований момент наступної операції."""
+        with self.lock:
+            slot = self.next_time
+            self.next_time += self.interval
+            return slot
+
+
+def worker(ctx: LoadContext, weights: Dict[str, float], deadline: float,
+           stats: LoadStats, limiter: Optional[RateLimiter]) -> None:
+    """
+    Виконує операції на власному з'єднанні до настання deadline.
+
+    При заданій швидкості затримка рахується від запланованого моменту запуску,
+    тому черга на стороні клієнта також потрапляє у результати.
+    Якщо з'єднання втрачено, потік завершується і фіксується у stats.lost_workers,
+    щоб звіт показав, що навантаження було меншим за задане.
+
+    Args:
+        ctx (LoadContext): Спільні дані
+        weights: Ваги операцій
+        deadline (float): Момент завершення (time.perf_counter)
+        stats (LoadStats): Збирач статистики
+        limiter (Optional[RateLimiter]): Обмежувач швидкості або None
+    """
+    names = list(weights)
+    op_weights = list(weights.values())
+
+    try:
+        with create_connection() as conn:
+            with conn.cursor() as cursor:
+                while True:
+                    if limiter is not None:
+                        start = limiter.next_slot()
+                        delay = start - time.perf_counter()
+                        if delay > 0:
+                            time.sleep(delay)
+                    else:
+                        start = time.perf_counter()
+                    if start >= deadline:
+                        break
+
+                    name = random.choices(names, op_weights)[0]
+                    try:
+                        OPERATIONS[name](cursor, ctx)
+                        conn.commit()
+                        stats.record(name, (time.perf_counter() - start) * 1000)
+                    except Exception:
+                        stats.record(name, 0, error=True)
+                        # Після розриву з'єднання rollback теж завершується помилкою
+                        conn.rollback()
+    except psycopg2.Error as e:
+        # Потік не може продовжувати без з'єднання; фіксуємо це у звіті
+        stats.record_lost_worker(str(e).strip())
+
+
+def run_load(workers: int, duration: float, mix: str = DEFAULT_MIX, rate: Optional[float] = None) -> LoadStats:
+    """
+    Запускає навантаження і повертає зібрану статистику.
+
+    Args:
+        workers (int): Кількість паралельних потоків (і з'єднань)
+        duration (float): Тривалість у секундах
+        mix (str): Суміш операцій
+        rate (Optional[float]): Цільова кількість операцій за секунду
+            або None для замкненої моделі (кожен потік працює без пауз)
+
+    Returns:
+        LoadStats: Зібрана статистика
+    """
+    weights = parse_mix(mix)
+    with create_connection() as conn:
+        ctx = LoadContext(conn)
+
+    stats = LoadStats()
+    start = time.perf_counter()
+    deadline = start + duration
+    limiter = RateLimiter(rate, start) if rate else None
+
+    threads = [
+        threading.Thread(target=worker, args=(ctx, weights, deadline, stats, limiter))
+        for _ in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats.report(time.perf_counter() - start)
+    return stats
+
+
+def main():
+    """
+    Головна функція для запуску навантаження з командного рядка.
+    """
+    parser = argparse.ArgumentParser(description="Генератор змішаного навантаження")
+    parser.add_argument("-w", "--workers", type=int, default=4, help="Кількість паралельних потоків")
+    parser.add_argument("-d", "--duration", type=float, default=30, help="Тривалість у секундах")
+    parser.add_argument("-r", "--rate", type=float, help="Цільова кількість операцій за секунду")
+    parser.add_argument("-m", "--mix", default=DEFAULT_MIX, help="Суміш операцій: назва=вага,...")
+    args = parser.parse_args()
+
+    try:
+        run_load(args.workers, args.duration, args.mix, args.rate)
+    except Exception as e:
+        print(f"Помилка: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""
+Модуль для паралельного експорту одного великого звіту у CSV.
+Звіт розбивається на діапазони tasks.id, кожен діапазон виконується
+на окремому з'єднанні у пулі процесів і записується у власний файл-шард.
+"""
+
+
+import argparse
+import csv
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Tuple
+from connect import create_connection
+from query_executor import QUERIES
+
+
+# Звіти, в яких стовпець id є ідентифікатором завдання (tasks.id)
+TASK_REPORTS = {
+    "user_tasks",
+    "uncompleted_tasks",
+    "tasks_by_user_email_domain",
+    "tasks_without_description",
+}
+
+# Кількість рядків, які серверний курсор передає за один раз
+FETCH_SIZE = 10_000
+
+# Відсоток сторінок таблиці для вибірки точок розбиття
+SAMPLE_PERCENT = 1
+
+OUTPUT_DIR = Path('query_results')
+SHARDS_DIR = OUTPUT_DIR / 'shards'
+
+Range = Tuple[Optional[int], Optional[int]]
+
+
+def get_split_ranges(connection, parts: int, sample: bool = False) -> List[Range]:
+    """
+    Розбиває tasks.id на напіввідкриті діапазони [low, high).
+
+    Перший і останній діапазони не мають нижньої та верхньої межі відповідно,
+    тому разом діапазони гарантовано покривають усі завдання.
+
+    Args:
+        connection: З'єднання з базою даних
+        parts (int): Кількість діапазонів
+        sample (bool): Брати точки розбиття з вибірки TABLESAMPLE замість
+            рівномірного поділу між min та max (краще для нерівномірних id)
+
+    Returns:
+        List[Range]: Список діапазонів (low, high), де None означає відсутність межі
+    """
+    bounds: List[int] = []
+    with connection.cursor() as cursor:
+        if sample and parts > 1:
+            fractions = [i / parts for i in range(1, parts)]
+            cursor.execute(
+                f"""
+                SELECT percentile_disc(%s::float8[]) WITHIN GROUP (ORDER BY id)
+                FROM tasks TABLESAMPLE SYSTEM ({SAMPLE_PERCENT})
+                """,
+                (fractions,)
+            )
+            bounds = sorted(set(cursor.fetchone()[0] or []))
+
+        if not bounds and parts > 1:
+            cursor.execute("SELECT min(id), max(id) FROM tasks")
+            min_id, max_id = cursor.fetchone()
+            if min_id is not None:
+                step = (max_id - min_id + 1) / parts
+                bounds = sorted({min_id + int(step * i) for i in range(1, parts)})
+
+    edges: List[Optional[int]] = [None, *bounds, None]
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def build_range_query(report: str, low: Optional[int], high: Optional[int]) -> Tuple[str, list]:
+    """
+    Обгортає SQL-запит звіту умовою на діапазон id.
+
+    Args:
+        report (str): Назва звіту з QUERIES
+        low (Optional[int]): Нижня межа (включно) або None
+        high (Optional[int]): Верхня межа (не включно) або None
+
+    Returns:
+        Tuple[str, list]: SQL-запит та його параметри
+    """
+    # Символи '%' у LIKE-шаблонах треба екранувати, бо запит виконується з параметрами
+    base = QUERIES[report].strip().rstrip(';').replace('%', '%%')
+    conditions, params = [], []
+    if low is not None:
+        conditions.append("report.id >= %s")
+        params.append(low)
+    if high is not None:
+        conditions.append("report.id < %s")
+        params.append(high)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return f"SELECT * FROM ({base}) report {where}", params
+
+
+def export_range(report: str, low: Optional[int], high: Optional[int], shard_path: str,
+                 snapshot: Optional[str] = None) -> Tuple[int, List[str]]:
+    """
+    Виконує звіт для одного діапазону на окремому з'єднанні та записує шард.
+
+    Шард записується без рядка заголовка, щоб шарди можна було просто склеїти.
+    Якщо передано знімок, транзакція працює з ним у режимі REPEATABLE READ,
+    тому всі шарди бачать дані на один і той самий момент часу.
+
+    Args:
+        report (str): Назва звіту з QUERIES
+        low (Optional[int]): Нижня межа діапазону
+        high (Optional[int]): Верхня межа діапазону
+        shard_path (str): Шлях до файлу шарда
+        snapshot (Optional[str]): Ідентифікатор знімка з pg_export_snapshot()
+
+    Returns:
+        Tuple[int, List[str]]: Кількість записаних рядків та назви стовпців
+    """
+    query, params = build_range_query(report, low, high)
+    rows = 0
+    with create_connection() as conn:
+        if snapshot is not None:
+            conn.set_session(isolation_level='REPEATABLE READ', readonly=True)
+            with conn.cursor() as cursor:
+                # Має бути першою командою транзакції
+                cursor.execute("SET TRANSACTION SNAPSHOT %s", (snapshot,))
+        # Іменований (серверний) курсор передає результат частинами
+        with conn.cursor(name=f"export_{report}") as cursor:
+            cursor.itersize = FETCH_SIZE
+            cursor.execute(query, params)
+            with open(shard_path, 'w', newline='', encoding='utf-8') as file:
+                writer = csv.writer(file)
+                while True:
+                    batch = cursor.fetchmany(FETCH_SIZE)
+                    if not batch:
+                        break
+                    writer.writerows(batch)
+                    rows += len(batch)
+            columns = [desc[0] for desc in cursor.description]
+    return rows, columns
+
+
+def concatenate_shards(shard_paths: List[Path], columns: List[str], filepath: Path) -> None:
+    """
+    Склеює шарди у заданому порядку в один CSV файл із заголовком.
+
+    Args:
+        shard_paths (List[Path]): Шляхи до шардів у порядку діапазонів
+        columns (List[str]): Назви стовпців для заголовка
+        filepath (Path): Шлях до результуючого файлу
+    """
+    with open(filepath, 'w', newline='', encoding='utf-8') as output:
+        csv.writer(output).writerow(columns)
+        for shard_path in shard_paths:
+            with open(shard_path, 'r', newline='', encoding='utf-8') as shard:
+                shutil.copyfileobj(shard, output)
+
+
+def shard_header_path(report: str) -> Path:
+    """
+    Повертає шлях до файлу із заголовком для шардів звіту.
+
+    Args:
+        report (str): Назва звіту
+
+    Returns:
+        Path: Шлях до файлу із заголовком
+    """
+    return SHARDS_DIR / f"{report}_header.csv"
+
+
+def remove_shards(report: str) -> None:
+    """
+    Видаляє шарди звіту та файл із заголовком, залишені попереднім експортом.
+
+    Args:
+        report (str): Назва звіту
+    """
+    for path in [*SHARDS_DIR.glob(f"{report}_[0-9]*.csv"), shard_header_path(report)]:
+        path.unlink(missing_ok=True)
+
+
+def parallel_export(report: str, workers: int = 4, sample: bool = False, concatenate: bool = True) -> int:
+    """
+    Експортує звіт паралельно, розбиваючи його на діапазони tasks.id.
+
+    Args:
+        report (str): Назва звіту з TASK_REPORTS
+        workers (int): Кількість процесів і з'єднань
+        sample (bool): Використовувати вибірку для точок розбиття
+        concatenate (bool): Склеїти шарди в query_results/<report>.csv;
+            інакше поруч із шардами записується <report>_header.csv із заголовком
+
+    Returns:
+        int: Загальна кількість експортованих рядків
+
+    Raises:
+        ValueError: Якщо звіт не можна розбити за tasks.id
+    """
+    if report not in TASK_REPORTS:
+        raise ValueError(f"Звіт '{report}' не підтримує розбиття за tasks.id")
+
+    # Транзакція координатора експортує знімок і має залишатися відкритою,
+    # доки всі процеси не імпортують його
+    with create_connection() as conn:
+        conn.set_session(isolation_level='REPEATABLE READ', readonly=True)
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT pg_export_snapshot()")
+            snapshot = cursor.fetchone()[0]
+        ranges = get_split_ranges(conn, workers, sample)
+
+        SHARDS_DIR.mkdir(parents=True, exist_ok=True)
+        remove_shards(report)
+        shard_paths = [SHARDS_DIR / f"{report}_{i:03d}.csv" for i in range(len(ranges))]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(export_range, report, low, high, str(path), snapshot)
+                for (low, high), path in zip(ranges, shard_paths)
+            ]
+            results = [future.result() for future in futures]
+
+    total = sum(rows for rows, _ in results)
+    if concatenate:
+        filepath = OUTPUT_DIR / f"{report}.csv"
+        concatenate_shards(shard_paths, results[0][1], filepath)
+        for path in shard_paths:
+            path.unlink()
+        print(f"Результати збережено у файл: {filepath}")
+    else:
+        # Шарди без заголовка: заголовок окремим файлом, щоб їх можна було склеїти
+        with open(shard_header_path(report), 'w', newline='', encoding='utf-8') as file:
+            csv.writer(file).writerow(results[0][1])
+    return total
+
+
+def main():
+    """
+    Головна функція для паралельного експорту звіту з командного рядка.
+    """
+    parser = argparse.ArgumentParser(description="Паралельний експорт звіту у CSV")
+    parser.add_argument("report", choices=sorted(TASK_REPORTS), help="Назва звіту")
+    parser.add_argument("-w", "--workers", type=int, default=4, help="Кількість процесів")
+    parser.add_argument("--sample", action="store_true", help="Точки розбиття з вибірки")
+    parser.add_argument("--no-concat", action="store_true", help="Залишити шарди окремими файлами")
+    args = parser.parse_args()
+
+    try:
+        start = time.perf_counter()
+        rows = parallel_export(args.report, args.workers, args.sample, not args.no_concat)
+        elapsed = time.perf_counter() - start
+        print(f"Експортовано {rows} рядків за {elapsed:.2f} с ({rows / elapsed:.0f} рядків/с)")
+        if args.no_concat:
+            print(f"Шарди збережено у каталог: {SHARDS_DIR} (заголовок у {shard_header_path(args.report).name})")
+    except Exception as e:
+        print(f"Помилка: {e}")
+
+
+if __name__ == "__main__":
+    main()
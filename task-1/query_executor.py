@@ -5,11 +5,22 @@
 
 
 import csv
+import hashlib
+import json
+import sys
+import time
+from datetime import datetime
 from pathlib import Path
 from connect import create_connection
 from typing import List, Dict, Any, Optional
 
 
+# Файл маніфесту з відбитками даних, за якими було збережено кожен звіт
+MANIFEST_PATH = Path('query_results') / 'manifest.json'
+
+# Таблиці, від яких залежать звіти
+TRACKED_TABLES = ('users', 'status', 'tasks')
+
 
 def execute_query(connection, query: str) -> Optional[List[Dict[str, Any]]]:
     """
@@ -60,103 +71,372 @@ def save_to_csv(results: List[Dict[str, Any]], filename: str) -> None:
         print(f"Помилка збереження файлу: {e}")
 
 
-def main():
+def get_tables_fingerprint(connection) -> Optional[str]:
     """
-    Головна функція для виконання запитів та збереження результатів.
+    Повертає дешевий відбиток стану таблиць users, status та tasks.
+
+    Відбиток складається з поточних значень послідовностей <таблиця>_version_seq,
+    які тригери збільшують після кожної зміни (див. create_tables.py).
+    nextval виконується до фіксації транзакції, тому відбиток треба читати
+    в окремій транзакції до знімка, в якому виконуються звіти
+    (див. has_transactions_in_progress).
+
+    Args:
+        connection: З'єднання з базою даних
+
+    Returns:
+        Optional[str]: Рядок-відбиток, що змінюється при будь-якій зміні даних,
+        або None, якщо послідовностей немає (кеш тоді вимикається)
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT sequencename, coalesce(last_value, 0)
+            FROM pg_sequences
+            WHERE sequencename = ANY(%s)
+            ORDER BY sequencename
+            """,
+            ([f"{table}_version_seq" for table in TRACKED_TABLES],)
+        )
+        versions = cursor.fetchall()
+
+    if len(versions) < len(TRACKED_TABLES):
+        return None
+    return ",".join(f"{name}={value}" for name, value in versions)
+
+
+def has_transactions_in_progress(connection) -> bool:
+    """
+    Перевіряє, чи були незавершені транзакції на момент знімка поточної транзакції.
+
+    Записувач збільшує лічильник версій ще до фіксації, тому звіт, виконаний
+    поки він працює, може містити старі дані з уже новим відбитком. Такий
+    результат не можна кешувати. Запит має бути першим у транзакції
+    REPEATABLE READ, щоб знімок збігався зі знімком звітів.
+
+    Знімок містить транзакції, що пишуть, з усього кластера, а не лише з таблиць
+    звітів: будь-який відкритий записувач (в іншій базі даних, read_model_sync.py,
+    load_generator.py) робить запуск некешованим. Тож кеш заощаджує роботу лише
+    тоді, коли на сервері немає записів, а не просто коли не змінювалися дані звітів.
+
+    Args:
+        connection: З'єднання з базою даних
+
+    Returns:
+        bool: True, якщо у знімку є незавершені транзакції
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT count(*) FROM txid_snapshot_xip(txid_current_snapshot())")
+        return cursor.fetchone()[0] > 0
+
+
+def get_cache_key(query: str, fingerprint: Optional[str]) -> Optional[str]:
+    """
+    Обчислює ключ кешу звіту з тексту запиту та відбитка даних.
+
+    Args:
+        query (str): SQL-запит звіту
+        fingerprint (Optional[str]): Відбиток стану таблиць
+
+    Returns:
+        Optional[str]: SHA-256 хеш у шістнадцятковому вигляді або None без відбитка
+    """
+    if fingerprint is None:
+        return None
+    return hashlib.sha256(f"{query}\n{fingerprint}".encode('utf-8')).hexdigest()
+
+
+def load_manifest() -> Dict[str, Dict[str, Any]]:
+    """
+    Читає маніфест збережених звітів.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Записи маніфесту за назвами звітів
+    """
+    try:
+        with open(MANIFEST_PATH, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(manifest: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Зберігає маніфест збережених звітів.
+
+    Args:
+        manifest: Записи маніфесту за назвами звітів
+    """
+    MANIFEST_PATH.parent.mkdir(exist_ok=True)
+    with open(MANIFEST_PATH, 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, ensure_ascii=False, indent=2)
+
+
+def is_report_fresh(entry: Optional[Dict[str, Any]], filename: str, cache_key: Optional[str]) -> bool:
+    """
+    Перевіряє, чи збережений звіт відповідає поточному стану даних.
+
+    Args:
+        entry: Запис маніфесту для звіту
+        filename (str): Назва файлу звіту
+        cache_key (Optional[str]): Поточний ключ кешу
+
+    Returns:
+        bool: True, якщо звіт можна не перезаписувати
+    """
+    if cache_key is None or not entry or entry.get("key") != cache_key:
+        return False
+    # Порожні результати не записуються у файл, тому перевіряємо файл лише для непорожніх
+    return entry.get("rows") == 0 or (MANIFEST_PATH.parent / f"{filename}.csv").exists()
+
+
+def update_manifest(manifest: Dict[str, Dict[str, Any]], filename: str, cache_key: Optional[str],
+                    fingerprint: Optional[str], rows: int, seconds: float) -> None:
     """
-    queries = {
-        "user_tasks": """
-            SELECT u.fullname, t.id, t.title, t.description, s.name as status
-            FROM tasks t
-            JOIN status s ON t.status_id = s.id
-            JOIN users u ON t.user_id = u.id
-            WHERE t.user_id = 50
-        """,
-
-        "tasks_by_status": """
-            SELECT s.name as status, t.title, t.description, u.fullname
-            FROM tasks t
-            JOIN users u ON t.user_id = u.id
-            JOIN status s ON t.status_id = s.id
-            WHERE t.status_id = (SELECT id FROM status WHERE name = 'Нове')
-        """,
-
-        "users_without_tasks": """
-            SELECT *
-            FROM users
-            WHERE id NOT IN (SELECT DISTINCT user_id FROM tasks)
-        """,
-
-        "uncompleted_tasks": """
-            SELECT t.id, t.title, t.description, s.name as status, u.fullname
-            FROM tasks t
-            JOIN status s ON t.status_id = s.id
-            JOIN users u ON t.user_id = u.id
-            WHERE s.name != 'Завершене'
-        """,
-
-        "users_by_email": """
-            SELECT *
-            FROM users
-            WHERE email LIKE '%@example.org'
-        """,
-
-        "task_statistics": """
-            SELECT s.name, COUNT(t.id) as tasks_count
-            FROM status s
-            LEFT JOIN tasks t ON s.id = t.status_id
-            GROUP BY s.name
-            ORDER BY tasks_count DESC
-        """,
-
-        "tasks_by_user_email_domain": """
-            SELECT t.id, t.title, t.description, u.fullname, u.email
-            FROM tasks t
-            JOIN users u ON t.user_id = u.id
-            WHERE u.email LIKE '%@example.com';
-        """,
-
-        "tasks_without_description": """
-            SELECT t.id, t.title, t.description, u.fullname
-            FROM tasks t
-            JOIN users u ON t.user_id = u.id
-            WHERE t.description IS NULL OR trim(t.description) = '';
-        """,
-
-        "in_progress_status_tasks": """
-            SELECT u.fullname, t.title, t.description
-            FROM users u
-            JOIN tasks t ON u.id = t.user_id
-            JOIN status s ON t.status_id = s.id
-            WHERE s.name = 'Виконується';
-        """,
-
-        "users_and_tasks_statistics": """
-            SELECT 
-                u.id,
-                u.fullname,
-                u.email,
-                COUNT(t.id) as tasks_count
-            FROM users u
-            LEFT JOIN tasks t ON u.id = t.user_id
-            GROUP BY u.id, u.fullname, u.email
-            ORDER BY tasks_count DESC
-        """
+    Оновлює запис маніфесту для звіту та зберігає маніфест.
+
+    Args:
+        manifest: Записи маніфесту за назвами звітів
+        filename (str): Назва файлу звіту
+        cache_key (Optional[str]): Ключ кешу звіту або None, якщо результат не можна кешувати
+        fingerprint (Optional[str]): Відбиток стану таблиць
+        rows (int): Кількість рядків у звіті
+        seconds (float): Час формування звіту
+    """
+    manifest[filename] = {
+        "key": cache_key,
+        "fingerprint": fingerprint,
+        "rows": rows,
+        "seconds": round(seconds, 4),
+        "updated_at": datetime.now().isoformat(timespec='seconds'),
     }
+    save_manifest(manifest)
+
+
+# Каталог звітів: назва файлу результату -> SQL-запит
+QUERIES = {
+    "user_tasks": """
+        SELECT u.fullname, t.id, t.title, t.description, s.name as status
+        FROM tasks t
+        JOIN status s ON t.status_id = s.id
+        JOIN users u ON t.user_id = u.id
+        WHERE t.user_id = 50
+    """,
+
+    "tasks_by_status": """
+        SELECT s.name as status, t.title, t.description, u.fullname
+        FROM tasks t
+        JOIN users u ON t.user_id = u.id
+        JOIN status s ON t.status_id = s.id
+        WHERE t.status_id = (SELECT id FROM status WHERE name = 'Нове')
+    """,
+
+    "users_without_tasks": """
+        SELECT *
+        FROM users
+        WHERE id NOT IN (SELECT DISTINCT user_id FROM tasks)
+    """,
+
+    "uncompleted_tasks": """
+        SELECT t.id, t.title, t.description, s.name as status, u.fullname
+        FROM tasks t
+        JOIN status s ON t.status_id = s.id
+        JOIN users u ON t.user_id = u.id
+        WHERE s.name != 'Завершене'
+    """,
+
+    "users_by_email": """
+        SELECT *
+        FROM users
+        WHERE email LIKE '%@example.org'
+    """,
+
+    "task_statistics": """
+        SELECT s.name, COUNT(t.id) as tasks_count
+        FROM status s
+        LEFT JOIN tasks t ON s.id = t.status_id
+        GROUP BY s.name
+        ORDER BY tasks_count DESC
+    """,
+
+    "tasks_by_user_email_domain": """
+        SELECT t.id, t.title, t.description, u.fullname, u.email
+        FROM tasks t
+        JOIN users u ON t.user_id = u.id
+        WHERE u.email LIKE '%@example.com';
+    """,
+
+    "tasks_without_description": """
+        SELECT t.id, t.title, t.description, u.fullname
+        FROM tasks t
+        JOIN users u ON t.user_id = u.id
+        WHERE t.description IS NULL OR trim(t.description) = '';
+    """,
+
+    "in_progress_status_tasks": """
+        SELECT u.fullname, t.title, t.description
+        FROM users u
+        JOIN tasks t ON u.id = t.user_id
+        JOIN status s ON t.status_id = s.id
+        WHERE s.name = 'Виконується';
+    """,
+
+    "users_and_tasks_statistics": """
+        SELECT 
+            u.id,
+            u.fullname,
+            u.email,
+            COUNT(t.id) as tasks_count
+        FROM users u
+        LEFT JOIN tasks t ON u.id = t.user_id
+        GROUP BY u.id, u.fullname, u.email
+        ORDER BY tasks_count DESC
+    """
+}
+
+# Один прохід по tasks з агрегацією за статусом, за користувачем
+# та за парою (користувач, статус). GROUPING повертає 2 для набору (status_id),
+# 1 для (user_id) та 0 для (user_id, status_id)
+SQL_COMBINED_STATISTICS = """
+    SELECT user_id, status_id, GROUPING(user_id, status_id) as grouping_id,
+           COUNT(*) as tasks_count
+    FROM tasks
+    GROUP BY GROUPING SETS ((status_id), (user_id), (user_id, status_id))
+"""
+
+# Звіти з QUERIES, які у комбінованому режимі будуються з SQL_COMBINED_STATISTICS
+COMBINED_REPORTS = ("task_statistics", "users_and_tasks_statistics", "users_without_tasks")
+
+
+def execute_combined_statistics(connection) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    """
+    Будує статистичні звіти за один прохід по таблиці tasks.
+
+    Результат GROUPING SETS розподіляється по звітах task_statistics,
+    users_and_tasks_statistics та users_without_tasks у тому ж форматі,
+    що й окремі запити з QUERIES, а також у звіт user_status_statistics
+    з кількістю завдань кожного користувача за статусами.
+
+    Args:
+        connection: З'єднання з базою даних
 
+    Returns:
+        Optional[Dict[str, List[Dict[str, Any]]]]: Результати за назвами звітів
+        або None у разі помилки
+    """
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(SQL_COMBINED_STATISTICS)
+            counts = cursor.fetchall()
+            # Довідкові таблиці невеликі, їх читання не сканує tasks
+            cursor.execute("SELECT id, name FROM status ORDER BY id")
+            statuses = cursor.fetchall()
+            cursor.execute("SELECT id, fullname, email FROM users ORDER BY id")
+            users = cursor.fetchall()
+
+    except Exception as e:
+        print(f"Помилка виконання запиту: {e}")
+        return None
+
+    by_status, by_user, by_user_status = {}, {}, []
+    for user_id, status_id, grouping_id, tasks_count in counts:
+        if grouping_id == 2:
+            by_status[status_id] = tasks_count
+        elif grouping_id == 1:
+            by_user[user_id] = tasks_count
+        else:
+            by_user_status.append((user_id, status_id, tasks_count))
+
+    status_names = dict(statuses)
+    users_statistics = [
+        {"id": user_id, "fullname": fullname, "email": email, "tasks_count": by_user.get(user_id, 0)}
+        for user_id, fullname, email in users
+    ]
+    return {
+        "task_statistics": sorted(
+            ({"name": name, "tasks_count": by_status.get(status_id, 0)} for status_id, name in statuses),
+            key=lambda row: row["tasks_count"], reverse=True
+        ),
+        "users_and_tasks_statistics": sorted(
+            users_statistics, key=lambda row: row["tasks_count"], reverse=True
+        ),
+        "users_without_tasks": [
+            {"id": row["id"], "fullname": row["fullname"], "email": row["email"]}
+            for row in users_statistics if row["tasks_count"] == 0
+        ],
+        "user_status_statistics": [
+            {"user_id": user_id, "status": status_names.get(status_id), "tasks_count": tasks_count}
+            for user_id, status_id, tasks_count in sorted(by_user_status)
+        ],
+    }
+
+
+def main(force: bool = False, combined: bool = False):
+    """
+    Головна функція для виконання запитів та збереження результатів.
+
+    Звіти, дані яких не змінилися з моменту попереднього запуску, пропускаються.
+    Результати, отримані під час незавершених записів, не кешуються.
+
+    Args:
+        force (bool): Перезаписати всі звіти незалежно від кешу
+        combined (bool): Будувати статистичні звіти одним проходом по tasks
+    """
     try:
         with create_connection() as conn:
-            for filename, query in queries.items():
+            fingerprint = get_tables_fingerprint(conn)
+            conn.commit()
+            if fingerprint is None:
+                print("\nЛічильники версій таблиць не знайдено (див. create_tables.py), кеш вимкнено")
+
+            # Усі звіти виконуються в одному знімку даних
+            conn.set_session(isolation_level='REPEATABLE READ', readonly=True)
+            cacheable = not has_transactions_in_progress(conn)
+            if fingerprint is not None and not cacheable:
+                print("\nНа сервері є незавершені транзакції, результати цього запуску не кешуються")
+            manifest = load_manifest()
+
+            if combined:
+                cache_key = get_cache_key(SQL_COMBINED_STATISTICS, fingerprint)
+                reports = (*COMBINED_REPORTS, "user_status_statistics")
+                if not force and all(is_report_fresh(manifest.get(name), name, cache_key) for name in reports):
+                    print("\nКомбінована статистика: дані не змінилися, пропущено")
+                else:
+                    print("\nВиконання комбінованого запиту статистики")
+                    start = time.perf_counter()
+                    results = execute_combined_statistics(conn)
+                    seconds = time.perf_counter() - start
+                    for filename, rows in (results or {}).items():
+                        if rows:
+                            save_to_csv(rows, filename)
+                        update_manifest(manifest, filename, cache_key if cacheable else None,
+                                        fingerprint, len(rows), seconds)
+
+            for filename, query in QUERIES.items():
+                if combined and filename in COMBINED_REPORTS:
+                    continue
+
+                cache_key = get_cache_key(query, fingerprint)
+                if not force and is_report_fresh(manifest.get(filename), filename, cache_key):
+                    print(f"\nЗапит {filename}: дані не змінилися, пропущено")
+                    continue
+
                 print(f"\nВиконання запиту: {filename}")
+                start = time.perf_counter()
                 results = execute_query(conn, query)
+                if results is None:
+                    continue
                 if results:
                     save_to_csv(results, filename)
                 else:
                     print("Запит не повернув результатів")
 
+                update_manifest(manifest, filename, cache_key if cacheable else None,
+                                fingerprint, len(results), time.perf_counter() - start)
+
     except Exception as e:
         print(f"Помилка підключення до бази даних: {e}")
 
 
 if __name__ == "__main__":
-    main()
+    main(force="--force" in sys.argv, combined="--combined" in sys.argv)
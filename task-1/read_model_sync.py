@@ -0,0 +1,315 @@
+"""
+Модуль для синхронізації денормалізованої моделі читання з PostgreSQL у MongoDB.
+Кожен користувач зберігається одним документом із вкладеними завданнями
+та назвами статусів. Спершу виконується повне завантаження, далі документи
+оновлюються інкрементально з журналу змін user_changes (див. create_tables.py).
+"""
+
+
+import importlib.util
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Iterable, Optional
+from pymongo import ReplaceOne
+from connect import create_connection, BASE_DIR
+
+
+# З'єднання з MongoDB беремо з task-2/connect.py. Модуль має таку ж назву,
+# як і task-1/connect.py, тому завантажуємо його за шляхом під іншим іменем
+MONGO_DIR = os.path.join(os.path.dirname(BASE_DIR), 'task-2')
+_spec = importlib.util.spec_from_file_location('mongo_connect', os.path.join(MONGO_DIR, 'connect.py'))
+mongo_connect = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(mongo_connect)
+
+MONGO_CONFIG_PATH = os.path.join(MONGO_DIR, 'config.ini')
+MONGO_DATABASE = 'tasks_db'
+USERS_COLLECTION = 'users'
+
+# Кількість документів в одному insert_many / bulk_write
+CHUNK_SIZE = 1000
+
+# Кількість записів журналу змін, що обробляються за один крок
+CHANGES_BATCH = 5000
+
+SQL_USER_DOCUMENTS = """
+    SELECT u.id, u.fullname, u.email, t.id, t.title, t.description, s.name
+    FROM users u
+    LEFT JOIN tasks t ON t.user_id = u.id
+    LEFT JOIN status s ON t.status_id = s.id
+    {where}
+    ORDER BY u.id, t.id
+"""
+
+
+def get_users_collection():
+    """
+    Повертає колекцію документів користувачів.
+
+    Returns:
+        Collection: Колекція users у базі tasks_db
+
+    Raises:
+        ConnectionError: Якщо не вдалося підключитися до MongoDB
+    """
+    client = mongo_connect.get_database_connection(MONGO_CONFIG_PATH)
+    if client is None:
+        raise ConnectionError("Не вдалося підключитися до MongoDB")
+    return client[MONGO_DATABASE][USERS_COLLECTION]
+
+
+def build_documents(rows: Iterable[tuple]) -> Iterable[Dict[str, Any]]:
+    """
+    Групує впорядковані за u.id рядки з'єднання у документи користувачів.
+
+    Args:
+        rows: Рядки запиту SQL_USER_DOCUMENTS
+
+    Yields:
+        Dict[str, Any]: Документ користувача з вкладеними завданнями
+    """
+    document = None
+    for user_id, fullname, email, task_id, title, description, status in rows:
+        if document is None or document["_id"] != user_id:
+            if document is not None:
+                yield document
+            document = {"_id": user_id, "fullname": fullname, "email": email, "tasks_count": 0, "tasks": []}
+        if task_id is not None:
+            document["tasks"].append(
+                {"id": task_id, "title": title, "description": description, "status": status}
+            )
+            document["tasks_count"] += 1
+    if document is not None:
+        yield document
+
+
+def stream_documents(connection, user_ids: Optional[List[int]] = None) -> Iterable[Dict[str, Any]]:
+    """
+    Потоково читає документи користувачів з PostgreSQL серверним курсором.
+
+    Args:
+        connection: З'єднання з PostgreSQL
+        user_ids (Optional[List[int]]): Обмежити вибірку цими користувачами
+
+    Yields:
+        Dict[str, Any]: Документ користувача
+    """
+    where, params = "", []
+    if user_ids is not None:
+        where, params = "WHERE u.id = ANY(%s)", [user_ids]
+    with connection.cursor(name="read_model_documents") as cursor:
+        cursor.itersize = CHUNK_SIZE * 10
+        cursor.execute(SQL_USER_DOCUMENTS.format(where=where), params)
+        yield from build_documents(cursor)
+
+
+def chunked(items: Iterable[Any], size: int) -> Iterable[List[Any]]:
+    """
+    Розбиває послідовність на списки заданого розміру.
+
+    Args:
+        items: Вхідна послідовність
+        size (int): Розмір частини
+
+    Yields:
+        List[Any]: Чергова частина
+    """
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def initial_load(connection, users) -> int:
+    """
+    Виконує повне завантаження документів користувачів у MongoDB.
+
+    Журнал змін очищається до початку читання, тому зміни, зроблені
+    під час завантаження, будуть застосовані наступною синхронізацією.
+
+    Args:
+        connection: З'єднання з PostgreSQL
+        users: Колекція документів користувачів
+
+    Returns:
+        int: Кількість завантажених документів
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("DELETE FROM user_changes")
+    connection.commit()
+
+    users.drop()
+    total = 0
+    for chunk in chunked(stream_documents(connection), CHUNK_SIZE):
+        for doc in chunk:
+            doc["synced_change_id"] = 0
+        users.insert_many(chunk, ordered=False)
+        total += len(chunk)
+    connection.commit()
+
+    users.create_index("email")
+    users.create_index("synced_change_id")
+    return total
+
+
+def sync_changes(connection, users) -> Dict[str, Any]:
+    """
+    Застосовує до MongoDB один пакет записів журналу змін.
+
+    Документи змінених користувачів перебудовуються повністю і замінюються
+    (ReplaceOne з upsert), тому повторна обробка тих самих змін безпечна.
+    Оброблені записи видаляються з журналу за їх id, а не за межею, тож
+    запис із меншим id, транзакція якого завершилася пізніше, не загубиться.
+
+    Args:
+        connection: З'єднання з PostgreSQL
+        users: Колекція документів користувачів
+
+    Returns:
+        Dict[str, Any]: Кількість оброблених змін і документів та затримка у секундах
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT id, user_id, changed_at
+            FROM user_changes
+            ORDER BY id
+            LIMIT %s
+            """,
+            (CHANGES_BATCH,)
+        )
+        changes = cursor.fetchall()
+
+    if not changes:
+        connection.commit()
+        return {"changes": 0, "documents": 0, "lag": 0.0}
+
+    # NULL у журналі означає зміну, що стосується всіх користувачів
+    full_resync = any(user_id is None for _, user_id, _ in changes)
+    user_ids = None if full_resync else sorted({user_id for _, user_id, _ in changes})
+
+    change_ids = [change_id for change_id, _, _ in changes]
+    sync_id = change_ids[-1]
+    seen = set()
+    documents = 0
+    for chunk in chunked(stream_documents(connection, user_ids), CHUNK_SIZE):
+        for doc in chunk:
+            doc["synced_change_id"] = sync_id
+        users.bulk_write([ReplaceOne({"_id": doc["_id"]}, doc, upsert=True) for doc in chunk], ordered=False)
+        seen.update(doc["_id"] for doc in chunk)
+        documents += len(chunk)
+
+    # Користувачі, яких більше немає в PostgreSQL, видаляються з MongoDB
+    if full_resync:
+        users.delete_many({"synced_change_id": {"$lt": sync_id}})
+    else:
+        users.delete_many({"_id": {"$in": [user_id for user_id in user_ids if user_id not in seen]}})
+
+    with connection.cursor() as cursor:
+        cursor.execute("DELETE FROM user_changes WHERE id = ANY(%s)", (change_ids,))
+    connection.commit()
+
+    lag = (datetime.now(timezone.utc) - changes[0][2]).total_seconds()
+    return {"changes": len(changes), "documents": documents, "lag": lag}
+
+
+def get_user_document(users, user_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Повертає документ користувача одним запитом за індексом _id.
+
+    Args:
+        users: Колекція документів користувачів
+        user_id (int): Ідентифікатор користувача
+
+    Returns:
+        Optional[Dict[str, Any]]: Документ користувача або None
+    """
+    return users.find_one({"_id": user_id})
+
+
+def verify(connection, users) -> int:
+    """
+    Порівнює кількість завдань кожного користувача у PostgreSQL та MongoDB.
+
+    Args:
+        connection: З'єднання з PostgreSQL
+        users: Колекція документів користувачів
+
+    Returns:
+        int: Кількість користувачів з розбіжностями
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT u.id, COUNT(t.id)
+            FROM users u
+            LEFT JOIN tasks t ON u.id = t.user_id
+            GROUP BY u.id
+            """
+        )
+        expected = dict(cursor.fetchall())
+    actual = {doc["_id"]: doc["tasks_count"] for doc in users.find({}, {"tasks_count": 1})}
+
+    mismatches = {user_id for user_id in expected.keys() | actual.keys() if expected.get(user_id) != actual.get(user_id)}
+    for user_id in sorted(mismatches)[:10]:
+        print(f"Користувач {user_id}: PostgreSQL={expected.get(user_id)}, MongoDB={actual.get(user_id)}")
+    return len(mismatches)
+
+
+def main():
+    """
+    Головна функція. Команди:
+        load — повне завантаження;
+        sync [інтервал] — безперервна інкрементальна синхронізація;
+        get <user_id> — вивести документ користувача;
+        verify — перевірити узгодженість даних.
+    """
+    command = sys.argv[1] if len(sys.argv) > 1 else "load"
+
+    try:
+        users = get_users_collection()
+        with create_connection() as conn:
+            if command == "load":
+                start = time.perf_counter()
+                total = initial_load(conn, users)
+                elapsed = time.perf_counter() - start
+                print(f"Завантажено {total} документів за {elapsed:.2f} с ({total / elapsed:.0f} док./с)")
+
+            elif command == "sync":
+                interval = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+                while True:
+                    start = time.perf_counter()
+                    result = sync_changes(conn, users)
+                    elapsed = time.perf_counter() - start
+                    if result["changes"]:
+                        print(
+                            f"Змін: {result['changes']}, документів: {result['documents']}, "
+                            f"затримка: {result['lag']:.2f} с, {result['documents'] / elapsed:.0f} док./с"
+                        )
+                    if result["changes"] < CHANGES_BATCH:
+                        time.sleep(interval)
+
+            elif command == "get":
+                document = get_user_document(users, int(sys.argv[2]))
+                print(document if document else "Користувача не знайдено")
+
+            elif command == "verify":
+                mismatches = verify(conn, users)
+                print("Дані узгоджені" if not mismatches else f"Розбіжностей: {mismatches}")
+
+            else:
+                print(f"Невідома команда: {command}")
+
+    except KeyboardInterrupt:
+        print("\nСинхронізацію зупинено")
+    except Exception as e:
+        print(f"Помилка: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Модуль для посторінкового отримання завдань з бази даних PostgreSQL.
+Використовує keyset-пагінацію за (status_id, id) або (user_id, id)
+з непрозорим курсором, тому кожна сторінка коштує стільки ж, скільки перша.
+"""
+
+
+import base64
+import json
+from typing import List, Dict, Any, Optional, Tuple
+from connect import create_connection
+
+
+# Розмір сторінки за замовчуванням
+DEFAULT_PAGE_SIZE = 50
+
+# Допустимі ключі сортування та відповідні стовпці таблиці tasks
+ORDER_COLUMNS = {
+    "status": "t.status_id",
+    "user": "t.user_id",
+}
+
+
+def encode_cursor(order_by: str, key: int, task_id: int) -> str:
+    """
+    Кодує позицію останнього рядка сторінки у непрозорий курсор.
+
+    Args:
+        order_by (str): Ключ сортування ('status' або 'user')
+        key (int): Значення status_id або user_id останнього рядка
+        task_id (int): Ідентифікатор останнього завдання
+
+    Returns:
+        str: Курсор для отримання наступної сторінки
+    """
+    payload = json.dumps({"o": order_by, "k": key, "id": task_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, order_by: str) -> Tuple[int, int]:
+    """
+    Декодує курсор у пару (ключ сортування, id завдання).
+
+    Args:
+        cursor (str): Курсор, отриманий з попередньої сторінки
+        order_by (str): Очікуваний ключ сортування
+
+    Returns:
+        Tuple[int, int]: Значення ключа сортування та id останнього завдання
+
+    Raises:
+        ValueError: Якщо курсор пошкоджений або створений для іншого сортування
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        key, task_id = int(payload["k"]), int(payload["id"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Некоректний курсор: {cursor}") from e
+
+    if payload.get("o") != order_by:
+        raise ValueError("Курсор створено для іншого порядку сортування")
+    return key, task_id
+
+
+def list_tasks(
+    connection,
+    order_by: str = "status",
+    status_id: Optional[int] = None,
+    user_id: Optional[int] = None,
+    email_domain: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Повертає одну сторінку завдань з можливістю фільтрації.
+
+    Args:
+        connection: З'єднання з базою даних
+        order_by (str): Ключ сортування: 'status' — (status_id, id), 'user' — (user_id, id)
+        status_id (Optional[int]): Фільтр за статусом
+        user_id (Optional[int]): Фільтр за користувачем
+        email_domain (Optional[str]): Фільтр за доменом email користувача, напр. 'example.com'
+        cursor (Optional[str]): Курсор попередньої сторінки або None для першої
+        limit (int): Кількість завдань на сторінці
+
+    Returns:
+        Tuple[List[Dict[str, Any]], Optional[str]]: Завдання сторінки та курсор
+        наступної сторінки (None, якщо сторінка остання)
+
+    Raises:
+        ValueError: Якщо передано невідомий ключ сортування, некоректний курсор
+            або розмір сторінки менший за 1
+    """
+    if order_by not in ORDER_COLUMNS:
+        raise ValueError(f"Невідомий ключ сортування: {order_by}")
+    if limit < 1:
+        raise ValueError(f"Розмір сторінки має бути додатним: {limit}")
+    order_column = ORDER_COLUMNS[order_by]
+
+    conditions = []
+    params: List[Any] = []
+
+    if status_id is not None:
+        conditions.append("t.status_id = %s")
+        params.append(status_id)
+    if user_id is not None:
+        conditions.append("t.user_id = %s")
+        params.append(user_id)
+    if email_domain is not None:
+        # Вираз збігається з індексом idx_users_email_domain
+        conditions.append("lower(split_part(u.email, '@', 2)) = %s")
+        params.append(email_domain.lower())
+    if cursor is not None:
+        # Порівняння кортежів дозволяє почати сканування індексу одразу з потрібної позиції
+        conditions.append(f"({order_column}, t.id) > (%s, %s)")
+        params.extend(decode_cursor(cursor, order_by))
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    query = f"""
+        SELECT t.id, t.title, t.description, t.status_id, t.user_id,
+               s.name as status, u.fullname, u.email
+        FROM tasks t
+        JOIN status s ON t.status_id = s.id
+        JOIN users u ON t.user_id = u.id
+        {where}
+        ORDER BY {order_column}, t.id
+        LIMIT %s
+    """
+    # Вибираємо на один рядок більше, щоб знати, чи існує наступна сторінка
+    params.append(limit + 1)
+
+    with connection.cursor() as db_cursor:
+        db_cursor.execute(query, params)
+        columns = [desc[0] for desc in db_cursor.description]
+        rows = [dict(zip(columns, row)) for row in db_cursor.fetchall()]
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(order_by, last[f"{order_by}_id"], last["id"])
+    return rows, next_cursor
+
+
+def main():
+    """
+    Демонстрація посторінкового перегляду завдань.
+    """
+    try:
+        with create_connection() as conn:
+            page_cursor = None
+            page = 1
+            while True:
+                tasks, page_cursor = list_tasks(conn, order_by="user", cursor=page_cursor, limit=10)
+                print(f"\nСторінка {page}: {len(tasks)} завдань")
+                for task in tasks:
+                    print(f"  [{task['user_id']}:{task['id']}] {task['title']} ({task['status']})")
+                if page_cursor is None or page >= 3:
+                    break
+                page += 1
+
+    except Exception as e:
+        print(f"Помилка: {e}")
+
+
+if __name__ == "__main__":
+    main()
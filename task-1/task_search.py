@@ -0,0 +1,107 @@
+"""
+Модуль для повнотекстового пошуку завдань за назвою та описом.
+Використовує згенерований стовпець search_vector та GIN-індекс,
+створені у create_tables.py.
+"""
+
+
+import re
+import sys
+from typing import List, Dict, Any
+from connect import create_connection
+
+
+# Конфігурація текстового пошуку, з якою побудовано search_vector
+SEARCH_CONFIG = 'simple'
+
+# Розмір сторінки результатів пошуку за замовчуванням
+DEFAULT_PAGE_SIZE = 20
+
+# Мінімальна довжина слова для префіксного пошуку: однолітерний префікс
+# (наприклад, 'п' з "п'ять", яке парсер розбиває на 'п' та 'ять')
+# збігається з надто великою частиною GIN-індексу
+MIN_PREFIX_LENGTH = 2
+
+
+def build_tsquery(text: str, prefix: bool = True) -> str:
+    """
+    Перетворює введений текст на вираз tsquery.
+
+    Для української мови немає стемера, тому за замовчуванням кожне слово
+    шукається як префікс: 'звіт' знайде також 'звіту', 'звітом' тощо.
+    У префіксному режимі слова, коротші за MIN_PREFIX_LENGTH, відкидаються.
+
+    Args:
+        text (str): Текст пошукового запиту
+        prefix (bool): Чи шукати слова як префікси
+
+    Returns:
+        str: Вираз tsquery, в якому всі слова об'єднані через '&'
+    """
+    words = re.findall(r"\w+", text.lower())
+    if prefix:
+        words = [word for word in words if len(word) >= MIN_PREFIX_LENGTH]
+    suffix = ":*" if prefix else ""
+    return " & ".join(f"{word}{suffix}" for word in words)
+
+
+def search_tasks(
+    connection,
+    text: str,
+    page: int = 1,
+    limit: int = DEFAULT_PAGE_SIZE,
+    prefix: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Шукає завдання, що згадують заданий текст, і впорядковує їх за релевантністю.
+
+    Args:
+        connection: З'єднання з базою даних
+        text (str): Текст пошукового запиту
+        page (int): Номер сторінки результатів, починаючи з 1
+        limit (int): Кількість результатів на сторінці
+        prefix (bool): Чи шукати слова як префікси
+
+    Returns:
+        List[Dict[str, Any]]: Знайдені завдання з оцінкою релевантності rank
+    """
+    tsquery = build_tsquery(text, prefix)
+    if not tsquery:
+        return []
+
+    query = f"""
+        SELECT t.id, t.title, t.description, s.name as status, u.fullname,
+               ts_rank(t.search_vector, q) as rank
+        FROM tasks t
+        JOIN status s ON t.status_id = s.id
+        JOIN users u ON t.user_id = u.id,
+             to_tsquery('{SEARCH_CONFIG}', %s) q
+        WHERE t.search_vector @@ q
+        ORDER BY rank DESC, t.id
+        LIMIT %s OFFSET %s
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(query, (tsquery, limit, (max(page, 1) - 1) * limit))
+        columns = [desc[0] for desc in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def main():
+    """
+    Головна функція: шукає завдання за текстом з аргументів командного рядка.
+    """
+    text = " ".join(sys.argv[1:]) or "звіт"
+
+    try:
+        with create_connection() as conn:
+            results = search_tasks(conn, text)
+            print(f"Знайдено {len(results)} завдань за запитом '{text}':")
+            for task in results:
+                print(f"  [{task['id']}] {task['title']} (rank={task['rank']:.3f})")
+
+    except Exception as e:
+        print(f"Помилка: {e}")
+
+
+if __name__ == "__main__":
+    main()
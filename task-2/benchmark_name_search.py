@@ -0,0 +1,110 @@
+"""
+Модуль для вимірювання затримки пошуку котів за іменем на великій колекції:
+префіксний пошук за індексом name_key на кожне натискання клавіші,
+побудова та інкрементальне оновлення індексу імен у пам'яті
+і підказки з помилками.
+
+Дані генеруються в окремій колекції, тому робоча колекція cats не змінюється.
+"""
+
+
+import sys
+import time
+from typing import Callable
+from connect import get_database_connection
+from cat_search import NameIndex, ensure_name_key_index, prefix_search
+from seed import generate_cat
+
+
+# Кількість котів у тестовій колекції та розмір однієї пачки вставки
+TARGET_CATS = 1_000_000
+INSERT_BATCH = 10_000
+
+BENCHMARK_COLLECTION = "cats_benchmark"
+
+
+def measure(func: Callable[[], None], repeats: int = 5) -> float:
+    """
+    Вимірює найкращий час виконання функції.
+
+    Args:
+        func: Функція для вимірювання
+        repeats (int): Кількість повторів
+
+    Returns:
+        float: Найменший час виконання у мілісекундах
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def grow_cats(collection, target: int) -> int:
+    """
+    Додає згенерованих котів, доки їх кількість не досягне target.
+
+    Args:
+        collection: Тестова колекція котів
+        target (int): Бажана кількість котів
+
+    Returns:
+        int: Кількість котів після заповнення
+    """
+    total = collection.count_documents({})
+    while total < target:
+        batch = [generate_cat() for _ in range(min(INSERT_BATCH, target - total))]
+        collection.insert_many(batch, ordered=False)
+        total += len(batch)
+    ensure_name_key_index(collection)
+    return total
+
+
+def main():
+    """
+    Головна функція: виводить затримку пошуку для кожного префікса введеного імені.
+    """
+    name = sys.argv[1] if len(sys.argv) > 1 else "Мар'яна"
+    typo = sys.argv[2] if len(sys.argv) > 2 else "Маряан"
+
+    try:
+        client = get_database_connection()
+        if client:
+            collection = client["cats_db"][BENCHMARK_COLLECTION]
+            total = grow_cats(collection, TARGET_CATS)
+            print(f"Котів у колекції: {total}")
+
+            print(f"\n{'Префікс':>10} {'prefix_search, мс':>18} {'Знайдено':>10}")
+            for length in range(1, len(name) + 1):
+                prefix = name[:length]
+                elapsed = measure(lambda: prefix_search(collection, prefix))
+                found = len(prefix_search(collection, prefix))
+                print(f"{prefix:>10} {elapsed:>18.2f} {found:>10}")
+
+            start = time.perf_counter()
+            index = NameIndex.build(collection)
+            build_time = time.perf_counter() - start
+            print(f"\nІндекс імен: {len(index)} унікальних імен, побудова {build_time:.2f} с")
+
+            print(f"Оновлення без змін (refresh): {measure(lambda: index.refresh(collection)):.2f} мс")
+
+            cat = generate_cat()
+            collection.insert_one(cat)
+            start = time.perf_counter()
+            added = index.refresh(collection)
+            print(f"Оновлення після вставки кота: {(time.perf_counter() - start) * 1000:.2f} мс (додано {added})")
+            collection.delete_one({"_id": cat["_id"]})
+            index.remove(cat["name"])
+
+            print(f"Підказки за префіксом '{name[:2]}': {measure(lambda: index.prefix(name[:2])):.3f} мс")
+            print(f"Підказки для '{typo}': {measure(lambda: index.suggest(typo)):.3f} мс")
+            print("Можливо, ви мали на увазі:", ", ".join(suggestion for suggestion, _ in index.suggest(typo)))
+
+    except Exception as e:
+        print(f"Помилка: {e}")
+
+
+if __name__ == "__main__":
+    main()
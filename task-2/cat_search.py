@@ -0,0 +1,289 @@
+"""
+Модуль для пошуку котів за частиною імені або за ім'ям з помилками.
+
+Сервер MongoDB виконує префіксний пошук за індексованим полем name_key
+(нормалізоване ім'я). Поле та індекс створює seed.py; для колекцій,
+заповнених раніше, одноразову міграцію виконує запуск цього модуля.
+Для підказок з урахуванням помилок будується індекс у пам'яті:
+відсортований список унікальних імен і триграмний індекс.
+"""
+
+
+import bisect
+import unicodedata
+from collections import Counter, defaultdict
+from typing import List, Dict, Any, Set, Tuple
+from pymongo import ASCENDING, UpdateOne
+from connect import get_database_connection
+
+
+# Назва поля з нормалізованим ім'ям та його індексу
+NAME_KEY_FIELD = "name_key"
+
+# Кількість документів в одному bulk_write під час заповнення name_key
+BACKFILL_BATCH = 1000
+
+# Різні варіанти апострофа в українських іменах (Мар'яна, Мар’яна, Марʼяна)
+APOSTROPHES = str.maketrans({"’": "'", "ʼ": "'", "`": "'", "‘": "'"})
+
+
+def normalize_name(name: str) -> str:
+    """
+    Нормалізує ім'я для пошуку: NFC, єдиний апостроф, casefold, без зайвих пробілів.
+
+    Args:
+        name (str): Ім'я кота
+
+    Returns:
+        str: Нормалізоване ім'я
+    """
+    return unicodedata.normalize("NFC", name).translate(APOSTROPHES).casefold().strip()
+
+
+def ensure_name_key_index(collection) -> int:
+    """
+    Створює індекс за полем name_key та заповнює його у документах, де його немає.
+
+    Args:
+        collection: Колекція котів
+
+    Returns:
+        int: Кількість оновлених документів
+    """
+    collection.create_index([(NAME_KEY_FIELD, ASCENDING)])
+
+    updated = 0
+    batch = []
+    for cat in collection.find({NAME_KEY_FIELD: {"$exists": False}}, {"name": 1}):
+        batch.append(UpdateOne({"_id": cat["_id"]}, {"$set": {NAME_KEY_FIELD: normalize_name(cat["name"])}}))
+        if len(batch) == BACKFILL_BATCH:
+            updated += collection.bulk_write(batch, ordered=False).modified_count
+            batch = []
+    if batch:
+        updated += collection.bulk_write(batch, ordered=False).modified_count
+    return updated
+
+
+def prefix_search(collection, prefix: str, limit: int = 10) -> List[Dict[str, Any]]:
+    """
+    Шукає котів, нормалізоване ім'я яких починається з prefix.
+
+    Запит є діапазоном [prefix, prefix + U+FFFF) за полем name_key,
+    тому MongoDB виконує його сканування індексу, а не всієї колекції.
+
+    Args:
+        collection: Колекція котів
+        prefix (str): Початок імені
+        limit (int): Максимальна кількість результатів
+
+    Returns:
+        List[Dict[str, Any]]: Знайдені коти
+    """
+    key = normalize_name(prefix)
+    if not key:
+        return []
+    return list(
+        collection.find({NAME_KEY_FIELD: {"$gte": key, "$lt": key + "\uffff"}})
+        .sort(NAME_KEY_FIELD, ASCENDING)
+        .limit(limit)
+    )
+
+
+def trigrams(key: str) -> Set[str]:
+    """
+    Розбиває нормалізоване ім'я на триграми з доповненням пробілами.
+
+    Args:
+        key (str): Нормалізоване ім'я
+
+    Returns:
+        Set[str]: Множина триграм
+    """
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex:
+    """
+    Індекс імен котів у пам'яті для автодоповнення та підказок з помилками.
+
+    Зберігає лише унікальні нормалізовані імена з кількістю котів,
+    тому його розмір залежить від кількості різних імен, а не котів.
+
+    Індекс належить одному процесу і оновлюється інкрементально через refresh:
+    нові коти підтягуються за індексом _id, видалення цього процесу
+    враховуються через remove та clear. Зміни інших клієнтів, які не можна
+    дочитати інкрементально (видалення, вставки із «старим» _id),
+    виявляються підрахунком і призводять до повної перебудови.
+    """
+
+    def __init__(self):
+        self.counts: Counter = Counter()
+        self.names: Dict[str, str] = {}
+        self.sorted_keys: List[str] = []
+        self.grams: Dict[str, Set[str]] = defaultdict(set)
+        self.total = 0
+        self.last_id = None
+
+    @classmethod
+    def build(cls, collection) -> "NameIndex":
+        """
+        Будує індекс сканом колекції з проєкцією лише поля name.
+
+        Args:
+            collection: Колекція котів
+
+        Returns:
+            NameIndex: Заповнений індекс
+        """
+        index = cls()
+        index.refresh(collection)
+        return index
+
+    def refresh(self, collection) -> int:
+        """
+        Доповнює індекс котами, створеними після останнього оновлення.
+
+        Спершу кількість документів з _id, не більшим за останній оброблений,
+        порівнюється з total. Якщо інший клієнт видалив котів або вставив
+        документ із меншим _id (ObjectId генерує клієнт, тому порядок між
+        клієнтами не гарантовано), числа розходяться і індекс перебудовується
+        повністю. Інакше дочитуються лише документи з більшим _id. Обидва
+        запити виконуються за індексом _id; підрахунок не читає документів.
+
+        Args:
+            collection: Колекція котів
+
+        Returns:
+            int: Кількість доданих котів (після перебудови — усіх)
+        """
+        if self.last_id is not None:
+            if collection.count_documents({"_id": {"$lte": self.last_id}}) != self.total:
+                self.clear()
+
+        query = {"_id": {"$gt": self.last_id}} if self.last_id is not None else {}
+        added = 0
+        for cat in collection.find(query, {"name": 1}).sort("_id", ASCENDING):
+            self.add(cat["name"])
+            self.last_id = cat["_id"]
+            added += 1
+        return added
+
+    def __len__(self) -> int:
+        return len(self.sorted_keys)
+
+    def add(self, name: str) -> None:
+        """
+        Додає ім'я одного кота до індексу.
+
+        Args:
+            name (str): Ім'я кота
+        """
+        # total рахує документи, тому враховує і котів з порожнім іменем
+        self.total += 1
+        key = normalize_name(name)
+        if not key:
+            return
+        if not self.counts[key]:
+            self.names[key] = name
+            bisect.insort(self.sorted_keys, key)
+            for gram in trigrams(key):
+                self.grams[gram].add(key)
+        self.counts[key] += 1
+
+    def remove(self, name: str, count: int = 1) -> None:
+        """
+        Видаляє ім'я одного або кількох котів з індексу.
+
+        Args:
+            name (str): Ім'я кота
+            count (int): Кількість видалених котів з цим ім'ям
+        """
+        key = normalize_name(name)
+        if not self.counts[key]:
+            return
+        self.total -= min(count, self.counts[key])
+        self.counts[key] -= count
+        if self.counts[key] > 0:
+            return
+
+        del self.counts[key]
+        del self.names[key]
+        self.sorted_keys.pop(bisect.bisect_left(self.sorted_keys, key))
+        for gram in trigrams(key):
+            self.grams[gram].discard(key)
+            if not self.grams[gram]:
+                del self.grams[gram]
+
+    def clear(self) -> None:
+        """Очищає індекс (наприклад, після видалення всіх котів)."""
+        self.__init__()
+
+    def prefix(self, text: str, limit: int = 10) -> List[Tuple[str, int]]:
+        """
+        Повертає імена, що починаються з text, за спаданням кількості котів.
+
+        Args:
+            text (str): Початок імені
+            limit (int): Максимальна кількість підказок
+
+        Returns:
+            List[Tuple[str, int]]: Пари (ім'я, кількість котів)
+        """
+        key = normalize_name(text)
+        if not key:
+            return []
+        start = bisect.bisect_left(self.sorted_keys, key)
+        end = bisect.bisect_left(self.sorted_keys, key + "\uffff", start)
+        matches = sorted(self.sorted_keys[start:end], key=lambda k: -self.counts[k])
+        return [(self.names[k], self.counts[k]) for k in matches[:limit]]
+
+    def suggest(self, text: str, limit: int = 5, min_similarity: float = 0.3) -> List[Tuple[str, float]]:
+        """
+        Повертає імена, схожі на text, ранжовані за триграмною схожістю (Dice).
+
+        Імена, що починаються з text, мають найвищу оцінку.
+
+        Args:
+            text (str): Введене (можливо, з помилкою) ім'я
+            limit (int): Максимальна кількість підказок
+            min_similarity (float): Мінімальна схожість від 0 до 1
+
+        Returns:
+            List[Tuple[str, float]]: Пари (ім'я, оцінка схожості)
+        """
+        key = normalize_name(text)
+        if not key:
+            return []
+        query_grams = trigrams(key)
+
+        shared: Counter = Counter()
+        for gram in query_grams:
+            for candidate in self.grams.get(gram, ()):
+                shared[candidate] += 1
+
+        scored = []
+        for candidate, common in shared.items():
+            score = 1.0 if candidate.startswith(key) else 2 * common / (len(query_grams) + len(trigrams(candidate)))
+            if score >= min_similarity:
+                scored.append((score, self.counts[candidate], candidate))
+        scored.sort(reverse=True)
+        return [(self.names[candidate], round(score, 3)) for score, _, candidate in scored[:limit]]
+
+
+def main():
+    """
+    Одноразова міграція: створює індекс name_key та заповнює поле в наявних котах.
+    """
+    try:
+        client = get_database_connection()
+        if client:
+            collection = client["cats_db"]["cats"]
+            updated = ensure_name_key_index(collection)
+            print(f"Поле {NAME_KEY_FIELD} заповнено у {updated} документах")
+    except Exception as e:
+        print(f"Помилка при міграції: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,10 +10,16 @@ from typing import Optional
 import certifi
 
 
-def get_database_connection() -> Optional[MongoClient]:
+def get_database_connection(config_path: str = 'config.ini') -> Optional[MongoClient]:
     """
     Створює підключення до MongoDB Atlas використовуючи конфігураційний файл.
+
+    Необов'язковий параметр TLS = false у секції MongoDB дозволяє
+    підключатися до локального mongod без SSL.
     
+    Args:
+        config_path (str): Шлях до файлу конфігурації
+
     Returns:
         Optional[MongoClient]: Об'єкт підключення до бази даних або None у разі помилки
         
@@ -24,9 +30,12 @@ def get_database_connection() -> Optional[MongoClient]:
     try:
         # Читаємо конфігурацію
         config = configparser.ConfigParser()
-        config.read('config.ini')
+        config.read(config_path)
         uri = config['MongoDB']['CONNECTION_STRING']
 
+        if not config['MongoDB'].getboolean('TLS', fallback=True):
+            return MongoClient(uri)
+
         # Створюємо клієнт з використанням ServerApi версії 1 та SSL сертифікатом
         client = MongoClient(
             uri,
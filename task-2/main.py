@@ -6,6 +6,47 @@
 
 from typing import Optional, Dict, Any
 from connect import get_database_connection
+from cat_search import NameIndex, prefix_search
+
+
+# Індекс імен у пам'яті для підказок з помилками. Будується лише в
+# інтерактивному меню (див. main), де процес живе довго і повний скан
+# колекції окупається; разові команди CLI обходяться без підказок
+suggestions_enabled = False
+name_index: Optional[NameIndex] = None
+
+
+def get_name_index(collection) -> NameIndex:
+    """
+    Повертає індекс імен, доповнений змінами з моменту останнього виклику.
+
+    Args:
+        collection: Колекція котів
+
+    Returns:
+        NameIndex: Індекс імен котів
+    """
+    global name_index
+    if name_index is None:
+        name_index = NameIndex.build(collection)
+    else:
+        name_index.refresh(collection)
+    return name_index
+
+
+def print_suggestions(collection, name: str) -> None:
+    """
+    Виводить схожі імена котів для введеного імені (лише в інтерактивному меню).
+
+    Args:
+        collection: Колекція котів
+        name (str): Введене ім'я
+    """
+    if not suggestions_enabled:
+        return
+    suggestions = get_name_index(collection).suggest(name)
+    if suggestions:
+        print("Можливо, ви мали на увазі:", ", ".join(suggestion for suggestion, _ in suggestions))
 
 
 def show_all_cats() -> None:
@@ -47,12 +88,39 @@ def find_cat_by_name(name: str) -> Optional[Dict[str, Any]]:
                 return cat
             else:
                 print(f"\nКота з ім'ям {name} не знайдено")
+                print_suggestions(collection, name)
                 return None
     except Exception as e:
         print(f"Помилка при пошуку: {e}")
         return None
 
 
+def search_cats_by_prefix(prefix: str, limit: int = 10) -> None:
+    """
+    Пошук котів за початком імені без урахування регістру.
+
+    Args:
+        prefix (str): Початок імені кота
+        limit (int): Максимальна кількість результатів
+    """
+    try:
+        client = get_database_connection()
+        if client:
+            db = client["cats_db"]
+            collection = db["cats"]
+            cats = prefix_search(collection, prefix, limit)
+
+            if cats:
+                print(f"\nЗнайдено котів: {len(cats)}")
+                for cat in cats:
+                    print_cat_info(cat)
+            else:
+                print(f"\nКотів з іменем, що починається на {prefix}, не знайдено")
+                print_suggestions(collection, prefix)
+    except Exception as e:
+        print(f"Помилка при пошуку: {e}")
+
+
 def update_cat_age(name: str, new_age: int) -> None:
     """
     Оновлення віку кота за ім'ям.
@@ -120,6 +188,8 @@ def delete_cat_by_name(name: str) -> None:
             result = collection.delete_one({"name": name})
 
             if result.deleted_count:
+                if name_index is not None:
+                    name_index.remove(name)
                 print(f"\nКота {name} видалено")
             else:
                 print(f"\nКота з ім'ям {name} не знайдено")
@@ -135,6 +205,8 @@ def delete_all_cats() -> None:
             db = client["cats_db"]
             collection = db["cats"]
             result = collection.delete_many({})
+            if name_index is not None:
+                name_index.clear()
             print(f"\nВидалено {result.deleted_count} записів")
     except Exception as e:
         print(f"Помилка при видаленні всіх записів: {e}")
@@ -154,6 +226,9 @@ def print_cat_info(cat: Dict[str, Any]) -> None:
 
 def main():
     """Головна функція для демонстрації роботи з базою даних."""
+    global suggestions_enabled
+    suggestions_enabled = True
+
     while True:
         print("\nОберіть операцію:")
         print("1. Показати всіх котів")
@@ -162,6 +237,7 @@ def main():
         print("4. Додати характеристику коту")
         print("5. Видалити кота")
         print("6. Видалити всіх котів")
+        print("7. Пошук котів за початком імені")
         print("0. Вийти")
 
         choice = input("\nВаш вибір: ")
@@ -189,6 +265,9 @@ def main():
             confirm = input("Ви впевнені? (y/n): ")
             if confirm.lower() == 'y':
                 delete_all_cats()
+        elif choice == "7":
+            prefix = input("Введіть початок імені: ")
+            search_cats_by_prefix(prefix)
         elif choice == "0":
             print("\nДо побачення!")
             break
@@ -7,6 +7,7 @@
 from faker import Faker
 import random
 from connect import get_database_connection
+from cat_search import NAME_KEY_FIELD, ensure_name_key_index, normalize_name
 from typing import Dict, Any
 
 
@@ -41,8 +42,12 @@ def generate_cat() -> Dict[str, Any]:
     # Вибираємо випадкові характеристики без повторень
     features = random.sample(CAT_FEATURES, num_features)
 
+    # Використовуємо імена людей як імена котів
+    name = fake.first_name()
+
     return {
-        "name": fake.first_name(),  # Використовуємо імена людей як імена котів
+        "name": name,
+        NAME_KEY_FIELD: normalize_name(name),  # Нормалізоване ім'я для пошуку
         "age": random.randint(1, 15),
         "features": features
     }
@@ -69,6 +74,9 @@ def seed_database(num_cats: int = 10) -> None:
             cats = [generate_cat() for _ in range(num_cats)]
             collection.insert_many(cats)
 
+            # Індекс для пошуку за початком імені
+            ensure_name_key_index(collection)
+
             print(f"Додано {num_cats} котів до бази даних")
 
             # Виведення прикладу доданих даних
@@ -0,0 +1,118 @@
+"""
+Регресійні тести часу холодного старту cli.py.
+
+Кожна команда запускається з python -X importtime у режимі --import-only:
+обробник імпортує всі модулі, потрібні команді, але не звертається до баз даних.
+Перевіряється, що важкі залежності іншої частини проєкту не імпортуються
+і що сумарний час імпортів не перевищує бюджет.
+"""
+
+
+import os
+import subprocess
+import sys
+from typing import Dict, List
+
+import pytest
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLI_PATH = os.path.join(BASE_DIR, 'cli.py')
+
+# Бюджет сумарного часу імпортів у мілісекундах
+HELP_BUDGET_MS = 50
+COMMAND_BUDGET_MS = 250
+
+HEAVY_MODULES = {'faker', 'psycopg2', 'pymongo', 'certifi', 'asyncpg'}
+POSTGRES_ONLY = {'faker', 'pymongo', 'certifi', 'asyncpg'}
+MONGO_ONLY = {'faker', 'psycopg2', 'asyncpg'}
+
+# (аргументи CLI, потрібні залежності, заборонені залежності)
+COMMANDS = [
+    (['create-tables'], ['psycopg2'], POSTGRES_ONLY),
+    (['query'], ['psycopg2'], POSTGRES_ONLY),
+    (['query', '--combined'], ['psycopg2'], POSTGRES_ONLY),
+    (['update'], ['psycopg2'], POSTGRES_ONLY),
+    (['seed'], ['psycopg2', 'faker'], {'pymongo', 'certifi', 'asyncpg'}),
+    (['cats', 'list'], ['pymongo', 'certifi'], MONGO_ONLY),
+    (['cats', 'find', 'x'], ['pymongo', 'certifi'], MONGO_ONLY),
+    (['cats', 'search', 'x'], ['pymongo', 'certifi'], MONGO_ONLY),
+    (['cats', 'delete', 'x'], ['pymongo', 'certifi'], MONGO_ONLY),
+    (['cats', 'migrate'], ['pymongo', 'certifi'], MONGO_ONLY),
+    (['cats', 'seed', '5'], ['pymongo', 'certifi', 'faker'], {'psycopg2', 'asyncpg'}),
+]
+
+
+def measure_imports(args: List[str]) -> Dict[str, int]:
+    """
+    Запускає інтерпретатор з -X importtime і повертає сукупний час імпортів.
+
+    Args:
+        args (List[str]): Аргументи інтерпретатора після -X importtime
+
+    Returns:
+        Dict[str, int]: Назва модуля -> сукупний час імпорту в мікросекундах
+        (для вкладених імпортів 0, бо їх час уже враховано в батьківському модулі)
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', *args],
+        capture_output=True, text=True, check=False
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    imports = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        nested = name.startswith('  ', 1)
+        imports[name.strip()] = 0 if nested else int(cumulative)
+    return imports
+
+
+@pytest.fixture(scope='module')
+def baseline() -> Dict[str, int]:
+    """Імпорти самого інтерпретатора (site, .pth-файли), які не залежать від CLI."""
+    return measure_imports(['-c', 'pass'])
+
+
+def cli_imports(cli_args: List[str], baseline: Dict[str, int]) -> Dict[str, int]:
+    """
+    Повертає імпорти, спричинені запуском CLI з заданими аргументами.
+
+    Args:
+        cli_args (List[str]): Аргументи cli.py
+        baseline (Dict[str, int]): Імпорти порожнього інтерпретатора
+
+    Returns:
+        Dict[str, int]: Назва модуля -> сукупний час імпорту в мікросекундах
+    """
+    imports = measure_imports([CLI_PATH, *cli_args])
+    return {name: cumulative for name, cumulative in imports.items() if name not in baseline}
+
+
+def top_packages(imports: Dict[str, int]) -> set:
+    """Повертає назви пакетів верхнього рівня серед імпортованих модулів."""
+    return {name.split('.')[0] for name in imports}
+
+
+@pytest.mark.parametrize('cli_args', [['--help'], ['query', '--help'], ['cats', '--help']])
+def test_help_imports_no_heavy_dependencies(cli_args, baseline):
+    imports = cli_imports(cli_args, baseline)
+
+    assert not top_packages(imports) & HEAVY_MODULES
+    assert sum(imports.values()) / 1000 < HELP_BUDGET_MS
+
+
+@pytest.mark.parametrize('cli_args, required, forbidden', COMMANDS, ids=lambda value: ' '.join(value) if isinstance(value, list) else None)
+def test_command_imports_only_what_it_needs(cli_args, required, forbidden, baseline):
+    for module in required:
+        pytest.importorskip(module)
+
+    imports = cli_imports(['--import-only', *cli_args], baseline)
+    packages = top_packages(imports)
+
+    # Залежність може бути вже імпортована самим інтерпретатором (через .pth)
+    assert set(required) <= packages | top_packages(baseline)
+    assert not packages & forbidden
+    assert sum(imports.values()) / 1000 < COMMAND_BUDGET_MS